@@ -2,7 +2,7 @@
 DevLog Code Analyzer - AI-powered code analysis
 """
 import json
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 import sqlite3
 from devlog.paths import DB_PATH
@@ -18,7 +18,13 @@ class CodeAnalyzer:
             'patterns': self._pattern_analysis,
         }
 
-    async def analyze_commit(self, commit_hash: str, analysis_type: str = 'quick', context: Optional[str] = None) -> Optional[Dict]:
+    async def analyze_commit(
+        self,
+        commit_hash: str,
+        analysis_type: str = 'quick',
+        context: Optional[str] = None,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> Optional[Dict]:
         """
         Analyze a specific commit
 
@@ -26,6 +32,8 @@ class CodeAnalyzer:
             commit_hash: Git commit hash (short or full)
             analysis_type: 'quick', 'deep', or 'patterns'
             context: Optional context to improve analysis (e.g., best practices)
+            on_progress: Called with each chunk of LLM output as it streams in
+                (quick analysis only; cached results produce no chunks)
 
         Returns:
             Analysis results or None if commit not found
@@ -83,7 +91,9 @@ class CodeAnalyzer:
         analyzer_func = self.analysis_types.get(analysis_type, self._quick_analysis)
         
         # Pass context if the analyzer function supports it (quick and deep do)
-        if analysis_type in ['quick', 'deep']:
+        if analysis_type == 'quick':
+            result = await analyzer_func(commit, changes, context, on_progress)
+        elif analysis_type == 'deep':
             result = await analyzer_func(commit, changes, context)
         else:
             result = await analyzer_func(commit, changes)
@@ -163,10 +173,39 @@ class CodeAnalyzer:
 
         return results
 
-    async def _quick_analysis(self, commit: Dict, changes: List[Dict], context_str: Optional[str] = None) -> Dict:
-        """Quick analysis: summary + immediate issues"""
+    async def _complete(
+        self,
+        prompt: str,
+        code: str,
+        language: str,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Run a prompt, feeding streamed output to on_progress when given"""
         from devlog.analysis.llm import analyze_code
 
+        if on_progress is None:
+            return await analyze_code(prompt, code, language)
+
+        response = await analyze_code(prompt, code, language, stream=True)
+        if isinstance(response, str):
+            # Long code is analyzed in chunks without streaming
+            on_progress(response)
+            return response
+
+        parts = []
+        async for token in response:
+            parts.append(token)
+            on_progress(token)
+        return "".join(parts)
+
+    async def _quick_analysis(
+        self,
+        commit: Dict,
+        changes: List[Dict],
+        context_str: Optional[str] = None,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> Dict:
+        """Quick analysis: summary + immediate issues"""
         # Build context
         context = {
             'commit_message': commit['message'],
@@ -185,7 +224,11 @@ class CodeAnalyzer:
                 continue
 
             prompt = self._build_quick_prompt(change, commit['message'], context_str)
-            analysis_text = await analyze_code(prompt, change['code_after'], change['language'])
+            if on_progress:
+                on_progress(f"\n── {change['file_path']} ──\n")
+            analysis_text = await self._complete(
+                prompt, change['code_after'], change['language'], on_progress
+            )
 
             parsed = self._parse_analysis_response(analysis_text)
             issues.extend(parsed.get('issues', []))
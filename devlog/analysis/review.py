@@ -1,6 +1,7 @@
 """
 Review Pipeline - Orchestrate full code review with web research
 """
+import asyncio
 import json
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -17,9 +18,14 @@ from devlog.analysis.compare import ComparisonEngine
 class ReviewPipeline:
     """Full code review pipeline: analyze + research + compare"""
 
-    def __init__(self):
-        self.analyzer = CodeAnalyzer()
-        self.searcher = WebSearcher()
+    def __init__(
+        self,
+        analyzer: Optional[CodeAnalyzer] = None,
+        searcher: Optional[WebSearcher] = None
+    ):
+        # Callers that already hold an analyzer/searcher can share them
+        self.analyzer = analyzer or CodeAnalyzer()
+        self.searcher = searcher or WebSearcher()
         self.scraper = WebScraper()
         self.extractor = ContentExtractor()
         self.comparer = ComparisonEngine()
@@ -52,11 +58,22 @@ class ReviewPipeline:
             'steps': []
         }
 
-        # Step 1: Find relevant commits
-        print(f"   Finding your {topic}-related code...")
-        commits = self._find_relevant_commits(topic, num_commits)
+        # Steps 1 & 2: Find relevant commits and search the web for best practices.
+        # They don't depend on each other, so the web search runs while the
+        # commits are looked up, and is dropped if there is nothing to review.
+        print(f"   Finding your {topic}-related code and searching web for best practices...")
+        web_search = asyncio.create_task(
+            asyncio.to_thread(self.searcher.search_topic, topic, language, 10)
+        )
+        try:
+            commits = await asyncio.to_thread(self._find_relevant_commits, topic, num_commits)
+        except BaseException:
+            web_search.cancel()
+            raise
 
         if not commits:
+            # The search thread can't be interrupted, but nothing waits for it
+            web_search.cancel()
             return {
                 'error': f"No commits found related to '{topic}'",
                 'suggestion': "Try a different topic or check your tracked repositories"
@@ -73,9 +90,7 @@ class ReviewPipeline:
             'files_analyzed': len(your_code)
         }
 
-        # Step 2: Search web for best practices (Moved up for context injection)
-        print(f"   Searching web for best practices...")
-        search_results = self.searcher.search_topic(topic, language, num_results=10)
+        search_results = await web_search
         review['web_search_results'] = len(search_results)
         review['steps'].append(f"Found {len(search_results)} web sources")
 
@@ -8,8 +8,8 @@ from textual.binding import Binding
 from textual import work
 from textual.events import Key
 from textual.screen import ModalScreen
+from rich.text import Text
 import logging
-import pyperclip
 
 from devlog.analysis.chat_manager import ChatManager
 from devlog.analysis.conversation_db import ConversationManager, init_conversation_tables
@@ -114,7 +114,10 @@ class ChatPanel(Container):
         self.current_conversation_id = None
         self.ai_response_widget = None
         self.message_count = 0
-        self.last_ai_response_text = ""
+        # Current AI reply: the Text shown on screen, plus the raw chunks
+        # (joined only when copied/saved)
+        self._ai_text = None
+        self._ai_chunks = []
 
     def compose(self) -> ComposeResult:
         # Status bar showing current conversation
@@ -134,6 +137,10 @@ class ChatPanel(Container):
 
     def on_mount(self) -> None:
         """Initialize chat"""
+        # Looked up once: add_message runs for every streamed chunk
+        self._messages_area = self.query_one("#chat-messages-area", VerticalScroll)
+        self._input = self.query_one("#chat-input", TextArea)
+
         # Initialize tables
         init_conversation_tables()
 
@@ -141,9 +148,11 @@ class ChatPanel(Container):
         self.action_new_conversation()
 
         # Welcome messages
-        self.add_message("system", "👋 Hello! I'm DevLog Enhanced.")
-        self.add_message("system", "💡 Try: '/help' for commands, or just ask naturally!")
-        self.add_message("system", "🔧 Available: search, analyze, review, stats, and more")
+        self.add_system_messages([
+            "👋 Hello! I'm DevLog Enhanced.",
+            "💡 Try: '/help' for commands, or just ask naturally!",
+            "🔧 Available: search, analyze, review, stats, and more",
+        ])
 
         # Focus input
         self.call_after_refresh(self.focus_input)
@@ -151,14 +160,32 @@ class ChatPanel(Container):
     def focus_input(self) -> None:
         """Focus the input field"""
         try:
-            self.query_one("#chat-input", TextArea).focus()
+            self._input.focus()
         except Exception as e:
             logger.error(f"Failed to focus input: {e}")
 
+    @staticmethod
+    def _system_label(content: str) -> Label:
+        return Label(
+            f"[bold green]System:[/bold green] {content}",
+            classes="chat-message system-message",
+            markup=True
+        )
+
+    def add_system_messages(self, contents: list[str]) -> None:
+        """Add several system messages with one mount and one scroll"""
+        try:
+            messages_area = self._messages_area
+            self.message_count += len(contents)
+            messages_area.mount_all([self._system_label(content) for content in contents])
+            messages_area.scroll_end(animate=False)
+        except Exception as e:
+            logger.error(f"Error adding messages: {e}")
+
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the chat display"""
         try:
-            messages_area = self.query_one("#chat-messages-area", VerticalScroll)
+            messages_area = self._messages_area
             self.message_count += 1
 
             if role == "user":
@@ -182,23 +209,17 @@ class ChatPanel(Container):
 
             elif role == "system":
                 # System message
-                msg = Label(
-                    f"[bold green]System:[/bold green] {content}",
-                    classes="chat-message system-message",
-                    markup=True
-                )
-                messages_area.mount(msg)
+                messages_area.mount(self._system_label(content))
                 messages_area.scroll_end(animate=False)
 
             elif role == "ai_start":
                 # Start a new AI response widget
+                self._ai_text = Text.assemble(("DevLog:", "bold magenta"), " ")
+                self._ai_chunks = []
                 self.ai_response_widget = Label(
-                    "[bold magenta]DevLog:[/bold magenta] ",
-                    classes="chat-message ai-message",
-                    markup=True
+                    self._ai_text,
+                    classes="chat-message ai-message"
                 )
-                self.ai_response_widget._content_buffer = "[bold magenta]DevLog:[/bold magenta] "
-                self.last_ai_response_text = ""
 
                 messages_area.mount(self.ai_response_widget)
                 messages_area.scroll_end(animate=False)
@@ -206,20 +227,27 @@ class ChatPanel(Container):
             elif role == "ai_stream":
                 # Append to existing AI response
                 if self.ai_response_widget:
-                    self.ai_response_widget._content_buffer += content
-                    self.last_ai_response_text += content
-                    self.ai_response_widget.update(self.ai_response_widget._content_buffer)
+                    # Appended as a plain span: brackets in the reply are never
+                    # parsed as markup, and nothing is re-parsed per chunk
+                    self._ai_text.append(content)
+                    self._ai_chunks.append(content)
+                    self.ai_response_widget.update(self._ai_text)
                     messages_area.scroll_end(animate=False)
 
         except Exception as e:
             logger.error(f"Error adding message: {e}")
 
+    @property
+    def last_ai_response_text(self) -> str:
+        """Unformatted text of the latest AI reply"""
+        return "".join(self._ai_chunks)
+
     async def on_key(self, event: Key) -> None:
         """Handle key events for submission"""
         if event.key == "enter":
             if not event.shift:
                 # Enter alone: submit message
-                if self.query_one("#chat-input", TextArea).has_focus:
+                if self._input.has_focus:
                     event.prevent_default()
                     event.stop()
                     await self.submit_message()
@@ -229,7 +257,7 @@ class ChatPanel(Container):
 
     async def submit_message(self) -> None:
         """Submit message from TextArea"""
-        input_widget = self.query_one("#chat-input", TextArea)
+        input_widget = self._input
         message = input_widget.text.strip()
         if message:
             input_widget.text = ""
@@ -248,15 +276,23 @@ class ChatPanel(Container):
 
     def action_copy_last_response(self) -> None:
         """Copy the last AI response to clipboard"""
-        if self.last_ai_response_text:
-            try:
-                pyperclip.copy(self.last_ai_response_text)
-                self.app.notify("📋 Copied last response!", severity="information")
-            except Exception as e:
-                self.app.notify(f"Failed to copy: {e}", severity="error")
+        text = self.last_ai_response_text
+        if text:
+            self._copy_to_clipboard(text)
         else:
             self.app.notify("No response to copy yet.", severity="warning")
 
+    @work(thread=True, group="clipboard")
+    def _copy_to_clipboard(self, text: str) -> None:
+        """Copy off the UI thread (pyperclip shells out to xclip/pbcopy/...)"""
+        try:
+            # Imported on first copy: probing the clipboard backends slows startup
+            import pyperclip
+            pyperclip.copy(text)
+            self.app.call_from_thread(self.app.notify, "📋 Copied last response!", severity="information")
+        except Exception as e:
+            self.app.call_from_thread(self.app.notify, f"Failed to copy: {e}", severity="error")
+
     def action_new_conversation(self) -> None:
         """Start new conversation"""
         # Auto-title old conversation if exists
@@ -273,7 +309,7 @@ class ChatPanel(Container):
         )
 
         # Clear chat display
-        messages_area = self.query_one("#chat-messages-area", VerticalScroll)
+        messages_area = self._messages_area
         messages_area.remove_children()
         self.message_count = 0
 
@@ -304,7 +340,7 @@ class ChatPanel(Container):
         self.chat_manager.repopulate_history(messages)
 
         # Clear current UI
-        messages_area = self.query_one("#chat-messages-area", VerticalScroll)
+        messages_area = self._messages_area
         messages_area.remove_children()
         self.message_count = 0
 
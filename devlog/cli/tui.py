@@ -12,21 +12,23 @@ from textual.binding import Binding
 from textual.reactive import reactive
 from textual.screen import Screen, ModalScreen
 from textual import work
+from rich.console import Console, Group
 from rich.syntax import Syntax
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table as RichTable
-from rich.progress import Progress as RichProgress
 import sqlite3
 from datetime import datetime
 from devlog.paths import DB_PATH
+from devlog.core.db import get_connection
 from devlog.core.search import get_commit_details, search_commits
-from devlog.analysis.analyzer import CodeAnalyzer
-from devlog.analysis.llm import test_connection
-from devlog.search.web_search import WebSearcher
-from devlog.analysis.review import ReviewPipeline
 import asyncio
+import functools
+import io
+import os
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 
 
 import logging
@@ -39,6 +41,190 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Delay before loading the highlighted commit's code (seconds)
+PREVIEW_DEBOUNCE = 0.05
+
+# Commit timeline query; kept constant so sqlite3's statement cache reuses it
+_LOAD_SQL_TEMPLATE = """
+    SELECT
+        c.id, c.short_hash, c.message, c.timestamp,
+        c.files_changed, r.repo_name
+    FROM git_commits c
+    JOIN tracked_repos r ON c.repo_id = r.id
+    WHERE r.active = 1 {after}
+    ORDER BY c.timestamp DESC, c.id DESC
+    LIMIT ?
+"""
+_LOAD_SQL = _LOAD_SQL_TEMPLATE.format(after="")
+# Keyset page: continue strictly after the last (timestamp, id) already shown,
+# so deeper pages are an index range search instead of an OFFSET scan
+_LOAD_MORE_SQL = _LOAD_SQL_TEMPLATE.format(after="AND (c.timestamp, c.id) < (?, ?)")
+
+# Commits per timeline page, and how close to the end the cursor gets
+# before the next page is fetched
+PAGE_SIZE = 50
+LOAD_MORE_THRESHOLD = 5
+
+# Live search waits this long after the last keystroke before querying
+SEARCH_DEBOUNCE = 0.15
+LIVE_SEARCH_MIN_CHARS = 3
+
+# Rows fetched and mounted per step while loading the timeline
+LOAD_BATCH_SIZE = 10
+
+# Shared read connection for the TUI, opened on first use. Only the single
+# DB thread (DevLogTUI.run_db) uses it, so it needs no lock.
+_CONN = None
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the TUI's long-lived SQLite connection"""
+    global _CONN
+    if _CONN is None:
+        conn = get_connection(
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=128
+        )
+        conn.row_factory = sqlite3.Row
+        if os.getenv("DEVLOG_SQL_TRACE"):
+            # Log every statement SQLite runs, to check statement reuse
+            conn.set_trace_callback(lambda sql: logger.debug("SQL: %s", sql))
+        _CONN = conn
+    return _CONN
+
+
+def _close_conn() -> None:
+    """Close the shared connection (on app exit)"""
+    global _CONN
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
+
+
+# Commits are immutable by hash, so their details can be cached without invalidation
+@functools.lru_cache(maxsize=128)
+def _details_cache(commit_hash: str):
+    """Commit details on the shared connection, memoized per hash"""
+    return get_commit_details(commit_hash, conn=_get_conn())
+
+
+def _search_commits(**kwargs) -> list:
+    """search_commits on the shared connection"""
+    return search_commits(conn=_get_conn(), **kwargs)
+
+
+def _query_commits(limit: int, after: tuple = None) -> sqlite3.Cursor:
+    """Start the timeline query (runs off the event loop)
+
+    Rows come back as sqlite3.Row; callers only index them by column name.
+    after is the (timestamp, id) of the last row of the previous page.
+    """
+    if after is None:
+        return _get_conn().execute(_LOAD_SQL, (limit,))
+    return _get_conn().execute(_LOAD_MORE_SQL, (*after, limit))
+
+
+class _CachedSyntax(Syntax):
+    """Syntax that runs the Pygments lexer once and reuses the result on re-render
+
+    line_number_width, when set, is the minimum number of digits in the line
+    number gutter, so chunks of one file line up whatever line they start at.
+    """
+
+    def __init__(self, *args, line_number_width: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.line_number_width = line_number_width
+
+    @property
+    def _numbers_column_width(self) -> int:
+        width = super()._numbers_column_width
+        digits = len(str(self.start_line + self.code.count("\n")))
+        if width and self.line_number_width > digits:
+            width += self.line_number_width - digits
+        return width
+
+    def highlight(self, code, line_range=None):
+        key = (code, line_range)
+        cached = getattr(self, "_highlighted", None)
+        if cached is None or cached[0] != key:
+            cached = (key, super().highlight(code, line_range))
+            self._highlighted = cached
+        # Rendering may stylize the Text, so hand out a copy
+        return cached[1].copy()
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether the lexer has already run for this object"""
+        return getattr(self, "_highlighted", None) is not None
+
+    def warm(self) -> None:
+        """Run the lexer ahead of the first render (safe to call from a thread)
+
+        Renders once to a throwaway console, so highlight() is called with the
+        code exactly as Rich prepares it for a real render.
+        """
+        for _ in Console(file=io.StringIO()).render(self):
+            pass
+
+
+@functools.lru_cache(maxsize=32)
+def _build_syntax(code: str, language: str, start_line: int = 1, line_number_width: int = 0) -> Syntax:
+    """Build (or reuse) the highlighted view for a file's code"""
+    return _CachedSyntax(
+        code,
+        language,
+        theme="monokai",
+        line_numbers=True,
+        word_wrap=False,
+        start_line=start_line,
+        line_number_width=line_number_width
+    )
+
+
+def _file_code(change: dict) -> str:
+    """The text CodeViewer shows for one changed file"""
+    return change.get('diff_text') or change.get('code_after') or "No code available"
+
+
+def _prewarm_syntax(changes: list, max_lines: int) -> None:
+    """Highlight files in the background so switching to them is instant"""
+    for change in changes:
+        code = _file_code(change)
+        # Large files are highlighted per window instead, so skip them here
+        if code.count("\n") >= max_lines:
+            continue
+        try:
+            syntax = _build_syntax(code, change.get('language', 'text'))
+            if not syntax.is_warm:
+                syntax.warm()
+        except Exception:
+            # The viewer highlights it again when shown; keep warming the rest
+            logger.debug("Pre-highlighting %s failed", change.get('file_path'), exc_info=True)
+
+
+# Seconds an Ollama probe result is reused before probing again
+CONN_CHECK_TTL = 10.0
+
+# Last Ollama probe as (monotonic timestamp, result)
+_last_conn_check = (0.0, False)
+
+
+def _cached_test_connection(ttl: float = CONN_CHECK_TTL) -> bool:
+    """Probe Ollama, reusing the last result if it is younger than ttl seconds"""
+    global _last_conn_check
+    from devlog.analysis.llm import test_connection
+
+    now = time.monotonic()
+    checked_at, ok = _last_conn_check
+    if checked_at and now - checked_at < ttl:
+        return ok
+
+    ok = test_connection()
+    _last_conn_check = (now, ok)
+    return ok
+
+
 # ==================== MODAL SCREENS ====================
 
 class ReviewInputModal(ModalScreen):
@@ -242,6 +428,10 @@ class CommitList(ListView):
     def __init__(self, auto_load: bool = True, **kwargs):
         super().__init__(**kwargs)
         self.auto_load = auto_load
+        # Keyset pagination state for the timeline
+        self._page_cursor = None
+        self._has_more = False
+        self._loading_more = False
 
     async def on_mount(self) -> None:
         if self.auto_load:
@@ -249,35 +439,75 @@ class CommitList(ListView):
 
     async def watch_commits(self, new_commits: list) -> None:
         """Update the list view when commits data changes"""
-        await self.clear()
-        if not new_commits:
+        self._has_more = False
+        # Hold screen updates so clearing and refilling paint as one frame
+        with self.app.batch_update():
+            await self.clear()
+            if not new_commits:
+                await self.append(ListItem(Label("[dim]No commits found[/]")))
+            else:
+                # Mount every row in one batch instead of one append per commit
+                await self.extend([CommitListItem(commit) for commit in new_commits])
+
+    async def _stream_page(self, limit: int, after: tuple = None) -> list:
+        """Fetch one timeline page and mount it batch by batch"""
+        cursor = await self.app.run_db(_query_commits, limit, after)
+
+        rows = []
+        while True:
+            # Fetch and mount batch by batch so the first rows paint immediately
+            batch = await self.app.run_db(cursor.fetchmany, LOAD_BATCH_SIZE)
+            if not batch:
+                break
+            rows.extend(batch)
+            await self.extend([CommitListItem(commit) for commit in batch])
+            await asyncio.sleep(0)
+
+        self._has_more = len(rows) == limit
+        if rows:
+            self._page_cursor = (rows[-1]['timestamp'], rows[-1]['id'])
+        return rows
+
+    async def load_commits(self, limit: int = PAGE_SIZE) -> None:
+        """Stream the latest commits into the list in small batches"""
+        self._has_more = False
+        self._page_cursor = None
+        try:
+            await self.clear()
+            commits = await self._stream_page(limit)
+        except (sqlite3.OperationalError, sqlite3.DatabaseError):
+            self.commits = []
+            return
+
+        if not commits:
             await self.append(ListItem(Label("[dim]No commits found[/]")))
-        else:
-            for commit in new_commits:
-                await self.append(CommitListItem(commit))
 
-    async def load_commits(self, limit: int = 50) -> None:
-        try:
-            conn = sqlite3.connect(DB_PATH)
-            conn.row_factory = sqlite3.Row
-            c = conn.cursor()
+        # Rows are already mounted; record them without re-running watch_commits
+        self.set_reactive(CommitList.commits, commits)
 
-            c.execute("""
-                SELECT
-                    c.id, c.short_hash, c.message, c.timestamp,
-                    c.files_changed, r.repo_name
-                FROM git_commits c
-                JOIN tracked_repos r ON c.repo_id = r.id
-                WHERE r.active = 1
-                ORDER BY c.timestamp DESC
-                LIMIT ?
-            """, (limit,))
-
-            # This assignment will trigger watch_commits
-            self.commits = [dict(row) for row in c.fetchall()]
-            conn.close()
+    @work(group="load-more")
+    async def load_more(self, limit: int = PAGE_SIZE) -> None:
+        """Append the next page of older commits to the timeline"""
+        if self._loading_more or not self._has_more:
+            return
+        self._loading_more = True
+        try:
+            rows = await self._stream_page(limit, self._page_cursor)
+            self.commits.extend(rows)
         except (sqlite3.OperationalError, sqlite3.DatabaseError):
-            self.commits = []
+            self._has_more = False
+        finally:
+            self._loading_more = False
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        # Fetch the next page as the cursor nears the bottom; the event
+        # still bubbles up to the app for the commit preview
+        if (
+            self._has_more
+            and self.index is not None
+            and self.index >= len(self.children) - LOAD_MORE_THRESHOLD
+        ):
+            self.load_more()
 
     def get_selected_commit(self):
         """Get currently selected commit"""
@@ -335,17 +565,31 @@ class SearchPanel(Container):
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Trigger search when Enter is pressed in input fields"""
-        self.trigger_search()
+        await self.trigger_search()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Search as the user types, once the query is long enough"""
+        query = self.query_one("#search-input", Input).value
+        if len(query.strip()) < LIVE_SEARCH_MIN_CHARS:
+            return
+        repo = self.query_one("#repo-input", Input).value
+        self.live_search(query, repo)
+
+    @work(exclusive=True, group="search")
+    async def live_search(self, query: str, repo: str) -> None:
+        """Debounced search: each keystroke cancels the pending one during the sleep"""
+        await asyncio.sleep(SEARCH_DEBOUNCE)
+        await self.perform_search(query, repo, quiet=True)
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "search-btn":
-            self.trigger_search()
+            await self.trigger_search()
 
     async def trigger_search(self) -> None:
         query = self.query_one("#search-input", Input).value
         repo = self.query_one("#repo-input", Input).value
         
-        print(f"DEBUG SEARCH: trigger_search called. Query='{query}', Repo='{repo}'")
+        logger.debug("Search: trigger_search query=%r repo=%r", query, repo)
 
         if not query and not repo:
             self.app.notify("Please enter a search term or repo filter", severity="warning")
@@ -353,21 +597,32 @@ class SearchPanel(Container):
         
         self.app.notify(f"Searching for '{query}' in repo '{repo or 'all'}'...", severity="information")
         
-        # Show loading state in the list
+        # Overlay a loading indicator; the old rows stay until results arrive
+        # so an identical result set needs no rebuild at all
         list_view = self.query_one("#search-results-list", CommitList)
-        list_view.commits = [] # Clear existing
-        await list_view.append(ListItem(Label("[yellow]Searching...[/]"))) # Add loading message
+        list_view.loading = True
 
-        # Run search in background
-        self.run_worker(self.perform_search(query, repo))
-
-    async def perform_search(self, query: str, repo: str) -> None:
-        print(f"DEBUG SEARCH: perform_search called. Query='{query}', Repo='{repo}'")
-        results = await asyncio.to_thread(search_commits, query=query, repo_name=repo, limit=50)
-        print(f"DEBUG SEARCH: perform_search received {len(results)} results.")
+        # Run search in background; Enter also supersedes a pending live search
+        self.run_worker(self.perform_search(query, repo), exclusive=True, group="search")
 
+    async def perform_search(self, query: str, repo: str, quiet: bool = False) -> None:
+        logger.debug("Search: perform_search query=%r repo=%r", query, repo)
         list_view = self.query_one("#search-results-list", CommitList)
+        try:
+            results = await self.app.run_db(_search_commits, query=query, repo_name=repo, limit=50)
+        finally:
+            list_view.loading = False
+        logger.debug("Search: perform_search got %d results", len(results))
+
+        # Same commits as already shown (e.g. Enter pressed again) - keep the rows
+        if results and [r['short_hash'] for r in results] == [c['short_hash'] for c in list_view.commits]:
+            if not quiet:
+                self.app.notify(f"Found {len(results)} commits (unchanged).", severity="information")
+            return
+
         list_view.commits = results
+        if quiet:
+            return
 
         if not results:
             self.app.notify("No commits found matching your criteria", severity="information")
@@ -376,23 +631,34 @@ class SearchPanel(Container):
 
 
 class CommitListItem(ListItem):
-    """Single commit list item"""
+    """Single commit list item
+
+    Renders its own text instead of composing a Label, so each row is one
+    widget, and the text is only built once the row is actually painted.
+    """
 
     def __init__(self, commit_data: dict):
         super().__init__()
         self.commit_data = commit_data
-
-    def compose(self) -> ComposeResult:
-        commit = self.commit_data
-        date = commit['timestamp'].split('T')[0]
-
-        # Format: [hash] message - repo (date)
-        msg = commit['message'][:60]
-        if len(commit['message']) > 60:
-            msg += "..."
-
-        text = f"[yellow]{commit['short_hash']}[/] {msg} [dim]- {commit['repo_name']} ({date})[/]"
-        yield Label(text, markup=True)
+        self._display = None
+
+    def render(self) -> Text:
+        if self._display is None:
+            commit_data = self.commit_data
+            # ISO-8601 timestamps: the date is always the first 10 characters
+            date = commit_data['timestamp'][:10]
+
+            # Format: [hash] message - repo (date)
+            msg = commit_data['message'][:60]
+            if len(commit_data['message']) > 60:
+                msg += "..."
+
+            self._display = Text.assemble(
+                (commit_data['short_hash'], "yellow"),
+                f" {msg} ",
+                (f"- {commit_data['repo_name']} ({date})", "dim"),
+            )
+        return self._display
 
 
 class CodeViewer(ScrollableContainer):
@@ -400,33 +666,99 @@ class CodeViewer(ScrollableContainer):
 
     code = reactive("")
     language = reactive("python")
-    current_files = reactive([])
-    current_file_index = reactive(0)
+
+    # Files longer than this are highlighted one viewport-sized window at a time
+    WINDOW_THRESHOLD = 400
+    # Extra lines highlighted above and below the visible region
+    WINDOW_MARGIN = 20
+    # Large files are highlighted in fixed-size chunks of this many lines
+    WINDOW_CHUNK = 100
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Per-viewer state (the search tab has its own CodeViewer)
+        self.current_files: list = []
+        self.current_file_index: int = 0
+        self._lines = []
+        self._window = None
+        # Bumped on every code change so late highlight results are dropped
+        self._render_token = 0
 
     def compose(self) -> ComposeResult:
         yield Static("Select a commit to view code", id="code-display")
 
-    def watch_code(self, new_code: str) -> None:
+    async def watch_code(self, new_code: str) -> None:
         widget = self.query_one("#code-display", Static)
+        self._render_token += 1
+        token = self._render_token
+        self._lines = []
+        self._window = None
+        widget.styles.padding = 0
+        widget.styles.min_height = None
 
         if not new_code:
             widget.update("No code to display")
             return
 
+        lines = new_code.splitlines()
+        if len(lines) > self.WINDOW_THRESHOLD:
+            self._lines = lines
+            self._render_window()
+            return
+
         try:
-            syntax = Syntax(
-                new_code,
-                self.language,
-                theme="monokai",
-                line_numbers=True,
-                word_wrap=False
-            )
+            syntax = _build_syntax(new_code, self.language)
+            if not syntax.is_warm:
+                # Lex in a worker thread instead of stalling the event loop
+                widget.update(Text("rendering...", style="dim"))
+                await self.app.run_blocking(syntax.warm)
+                if token != self._render_token:
+                    return
             widget.update(syntax)
-        except:
-            widget.update(new_code)
+        except Exception:
+            if token == self._render_token:
+                widget.update(new_code)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self._lines:
+            self._render_window()
+
+    def _render_window(self) -> None:
+        """Highlight only the chunks around the viewport of a large file"""
+        top = int(self.scroll_y)
+        height = self.scrollable_content_region.height or 40
+
+        # Still inside the highlighted window - nothing to do
+        if self._window and self._window[0] <= top and top + height <= self._window[1]:
+            return
+
+        # Snap to chunk boundaries so each chunk is lexed once and scrolling
+        # back to it is served from the _build_syntax cache
+        chunk = self.WINDOW_CHUNK
+        start = max(0, top - self.WINDOW_MARGIN) // chunk * chunk
+        end = min(len(self._lines), -(-(top + height + self.WINDOW_MARGIN) // chunk) * chunk)
+        self._window = (start, end)
 
-    def show_commit_code(self, commit_hash: str) -> None:
-        details = get_commit_details(commit_hash)
+        widget = self.query_one("#code-display", Static)
+        # Pad above the window and reserve the full height so scrolling covers the whole file
+        widget.styles.padding = (start, 0, 0, 0)
+        widget.styles.min_height = len(self._lines)
+
+        # Every chunk gets the gutter width of the file's last line number,
+        # so the code doesn't shift sideways where the digit count changes
+        width = len(str(len(self._lines)))
+        try:
+            widget.update(Group(*(
+                _build_syntax("\n".join(self._lines[pos:pos + chunk]), self.language, pos + 1, width)
+                for pos in range(start, end, chunk)
+            )))
+        except Exception as e:
+            logger.error(f"Error highlighting lines {start + 1}-{end}: {e}", exc_info=True)
+            widget.update("\n".join(self._lines[start:end]))
+
+    async def show_commit_code(self, commit_hash: str) -> None:
+        details = await self.app.run_db(_details_cache, commit_hash)
 
         if not details or not details.get('changes'):
             self.code = "No code changes in this commit"
@@ -442,19 +774,32 @@ class CodeViewer(ScrollableContainer):
             return
 
         change = self.current_files[index]
-        self.language = change.get('language', 'text')
+        code = _file_code(change)
+        language = change.get('language', 'text')
 
-        if change.get('diff_text'):
-            self.code = change['diff_text']
-        elif change.get('code_after'):
-            self.code = change['code_after']
-        else:
-            self.code = "No code available"
+        # Equal code doesn't fire watch_code, so only the title needs updating
+        # when both match; if just the language differs, force a re-highlight
+        if code == self.code and language != self.language:
+            self.set_reactive(CodeViewer.code, "")
+        self.language = language
+        self.code = code
 
         # Update border title
         total = len(self.current_files)
         self.border_title = f"Code: {change['file_path']} [{index+1}/{total}]"
 
+        self.prefetch_neighbours(index)
+
+    @work(exclusive=True, group="prefetch")
+    async def prefetch_neighbours(self, index: int) -> None:
+        """Highlight the next and previous files ahead of an n/p press"""
+        # A newer file switch cancels this, so only the current file's
+        # neighbours are prefetched
+        files = self.current_files
+        neighbours = [files[i] for i in (index + 1, index - 1) if 0 <= i < len(files)]
+        if neighbours:
+            await self.app.run_blocking(_prewarm_syntax, neighbours, self.WINDOW_THRESHOLD)
+
     def next_file(self) -> None:
         if self.current_file_index < len(self.current_files) - 1:
             self.current_file_index += 1
@@ -466,6 +811,68 @@ class CodeViewer(ScrollableContainer):
             self._show_file(self.current_file_index)
 
 
+# (result key, heading, heading style) for the numbered list sections
+_ANALYSIS_SECTIONS = (
+    ('issues', "Issues Found", "bold red"),
+    ('suggestions', "Suggestions", "bold green"),
+)
+ANALYSIS_MAX_ITEMS = 10
+
+# Streamed analysis output: minimum seconds between repaints, and how many
+# trailing characters are shown
+ANALYSIS_PAINT_INTERVAL = 0.05
+ANALYSIS_STREAM_TAIL = 2000
+
+
+def _append_numbered_section(text: Text, title: str, items: list, style: str) -> None:
+    """Append a heading plus up to ANALYSIS_MAX_ITEMS numbered items to text"""
+    text.append(f"{title} ({len(items)}):", style=style)
+    text.append("\n" + "".join(
+        f"  {i}. {item}\n" for i, item in enumerate(items[:ANALYSIS_MAX_ITEMS], 1)
+    ))
+    if len(items) > ANALYSIS_MAX_ITEMS:
+        text.append(f"  ...and {len(items) - ANALYSIS_MAX_ITEMS} more", style="dim")
+        text.append("\n")
+    text.append("\n")
+
+
+def _analysis_key(analysis: dict) -> tuple:
+    """Hashable snapshot of the parts of an analysis result that get rendered"""
+    return (
+        analysis.get('summary') or "",
+        tuple(
+            tuple(str(item) for item in analysis.get(key) or ())
+            for key, _, _ in _ANALYSIS_SECTIONS
+        ),
+        analysis.get('quality_score') or 0,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _render_analysis(key: tuple) -> Text:
+    """Build the AnalysisDisplay text for an _analysis_key snapshot"""
+    summary, sections, score = key
+    text = Text()
+
+    if summary:
+        text.append("Summary:", style="bold cyan")
+        text.append(f"\n{summary}\n\n")
+
+    for (_, title, style), items in zip(_ANALYSIS_SECTIONS, sections):
+        if items:
+            _append_numbered_section(text, title, items, style)
+
+    if score:
+        color = "green" if score >= 70 else "yellow" if score >= 50 else "red"
+        text.append("Quality Score:", style="bold")
+        text.append(" ")
+        text.append(f"{score}/100", style=color)
+
+    # Strip the blank line left after the last section
+    text.rstrip()
+    return text
+
+
 class AnalysisDisplay(ScrollableContainer):
     """Display AI analysis results"""
 
@@ -481,41 +888,23 @@ class AnalysisDisplay(ScrollableContainer):
             widget.update("No analysis available")
             return
 
-        lines = []
-
-        if new_analysis.get('summary'):
-            lines.append("[bold cyan]Summary:[/]")
-            lines.append(new_analysis['summary'])
-            lines.append("")
-
-        if new_analysis.get('issues'):
-            lines.append(f"[bold red]Issues Found ({len(new_analysis['issues'])}):[/]")
-            for i, issue in enumerate(new_analysis['issues'][:10], 1):
-                lines.append(f"  {i}. {issue}")
-            if len(new_analysis['issues']) > 10:
-                lines.append(f"  [dim]...and {len(new_analysis['issues']) - 10} more[/]")
-            lines.append("")
-
-        if new_analysis.get('suggestions'):
-            lines.append(f"[bold green]Suggestions ({len(new_analysis['suggestions'])}):[/]")
-            for i, sug in enumerate(new_analysis['suggestions'][:10], 1):
-                lines.append(f"  {i}. {sug}")
-            if len(new_analysis['suggestions']) > 10:
-                lines.append(f"  [dim]...and {len(new_analysis['suggestions']) - 10} more[/]")
-            lines.append("")
-
-        if new_analysis.get('quality_score'):
-            score = new_analysis['quality_score']
-            color = "green" if score >= 70 else "yellow" if score >= 50 else "red"
-            lines.append(f"[bold]Quality Score:[/] [{color}]{score}/100[/]")
-
-        text = Text.from_markup("\n".join(lines))
-        widget.update(text)
+        # Re-analyzing a commit returns an equal (cached) result, so the
+        # rendered Text is reused; copy it since rendering may restyle it
+        widget.update(_render_analysis(_analysis_key(new_analysis)).copy())
 
     def show_loading(self) -> None:
         widget = self.query_one("#analysis-display", Static)
         widget.update("[yellow]⟳ Analyzing...[/]")
 
+    def show_stream(self, partial: str) -> None:
+        """Show raw LLM output while an analysis is still generating"""
+        widget = self.query_one("#analysis-display", Static)
+        # Only the tail is visible anyway; keeps each repaint cheap
+        widget.update(Text.assemble(
+            ("⟳ Analyzing...\n", "yellow"),
+            (partial[-ANALYSIS_STREAM_TAIL:], "dim"),
+        ))
+
     def show_error(self, error: str) -> None:
         widget = self.query_one("#analysis-display", Static)
         widget.update(f"[red]Error:[/] {error}")
@@ -539,6 +928,8 @@ class ReviewWorkflow(VerticalScroll):
         )
 
     def on_mount(self) -> None:
+        # Rendered result sections, keyed by name -> (source data, Text)
+        self._sections = {}
         self.update_display()
 
     def watch_review_state(self, new_state: str) -> None:
@@ -576,18 +967,38 @@ class ReviewWorkflow(VerticalScroll):
         header.update(f"[bold cyan]Review Complete: {review['topic']}[/]")
         progress.update("")
 
-        # Build results display
+        # Issues and recommendations are only rebuilt when their source data
+        # changes. The source itself is kept (not its id) so it can't be freed
+        # and its id reused by a later review's data.
+        sections = self._sections
+        for name, source, build in (
+            ("issues", review.get('your_analysis', {}), self._build_issues),
+            ("recs", review.get('comparison', {}), self._build_recs),
+        ):
+            cached = sections.get(name)
+            if cached is None or cached[0] is not source:
+                sections[name] = (source, build(source))
+
+        self._results_text = Text().join([
+            self._build_summary(review),
+            sections["issues"][1],
+            sections["recs"][1],
+            Text.from_markup(f"[dim]Review ID: {review.get('id')}[/]"),
+        ])
+
+        results.update(self._results_text)
+
+    def _build_summary(self, review: dict) -> Text:
         lines = []
-
-        # Summary
         lines.append("[bold]Summary:[/]")
         lines.append(f"  • Commits analyzed: {review.get('commits_found', 0)}")
         lines.append(f"  • Web sources: {review.get('scraped_sources', 0)}")
         lines.append(f"  • Best practices found: {review.get('web_practices_found', 0)}")
         lines.append("")
+        return Text.from_markup("".join(line + "\n" for line in lines))
 
-        # Your code analysis
-        your_analysis = review.get('your_analysis', {})
+    def _build_issues(self, your_analysis: dict) -> Text:
+        lines = []
         if your_analysis.get('issues'):
             lines.append(f"[bold red]Your Code - Issues ({len(your_analysis['issues'])}):[/]")
             for i, issue in enumerate(your_analysis['issues'][:5], 1):
@@ -595,9 +1006,10 @@ class ReviewWorkflow(VerticalScroll):
             if len(your_analysis['issues']) > 5:
                 lines.append(f"  [dim]...and {len(your_analysis['issues']) - 5} more[/]")
             lines.append("")
+        return Text.from_markup("".join(line + "\n" for line in lines))
 
-        # Comparison
-        comparison = review.get('comparison', {})
+    def _build_recs(self, comparison: dict) -> Text:
+        lines = []
 
         if comparison.get('matches'):
             lines.append(f"[bold green]✓ Good Practices You're Following ({len(comparison['matches'])}):[/]")
@@ -621,9 +1033,7 @@ class ReviewWorkflow(VerticalScroll):
                 lines.append(f"     {rec['description'][:80]}...")
             lines.append("")
 
-        lines.append(f"[dim]Review ID: {review.get('id')}[/]")
-
-        results.update(Text.from_markup("\n".join(lines)))
+        return Text.from_markup("".join(line + "\n" for line in lines))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         try:
@@ -663,7 +1073,20 @@ class WebSearchPanel(VerticalScroll):
         yield Label("[bold cyan]Web Search[/]\n\nPress 'w' to search the web")
         yield Static(id="search-results")
 
-    def show_results(self, results: list) -> None:
+    @staticmethod
+    def _format_results(results: list) -> Text:
+        """Build the results text (pure, so it can run in a worker thread)"""
+        text = Text()
+        for i, result in enumerate(results[:10], 1):
+            # Appended as plain spans: titles and snippets are never parsed as markup
+            text.append(f"{i}. [{result['score']:.2f}] {result['title']}", style="bold cyan")
+            text.append("\n")
+            text.append(f"   {result['source']}", style="dim")
+            text.append(f"\n   {result['url']}\n   {result['snippet'][:150]}...\n\n")
+        text.rstrip()
+        return text
+
+    async def show_results(self, results: list) -> None:
         self.results = results
         widget = self.query_one("#search-results", Static)
 
@@ -671,15 +1094,7 @@ class WebSearchPanel(VerticalScroll):
             widget.update("[yellow]No results found[/]")
             return
 
-        lines = []
-        for i, result in enumerate(results[:10], 1):
-            lines.append(f"[bold cyan]{i}. [{result['score']:.2f}] {result['title']}[/]")
-            lines.append(f"   [dim]{result['source']}[/]")
-            lines.append(f"   {result['url']}")
-            lines.append(f"   {result['snippet'][:150]}...")
-            lines.append("")
-
-        widget.update(Text.from_markup("\n".join(lines)))
+        widget.update(await self.app.run_blocking(self._format_results, results))
 
 
 # ==================== MAIN APP ====================
@@ -759,6 +1174,64 @@ class DevLogTUI(App):
         Binding("q", "quit", "Quit", show=True),
     ]
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Dedicated threads so slow analysis/web work can't starve DB previews.
+        # Created here rather than in on_mount because child widgets start
+        # loading data from their own on_mount handlers. One DB thread: it owns
+        # the shared connection, and SQLite would serialize its queries anyway.
+        self._db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="devlog-db")
+        self._worker_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4,
+            thread_name_prefix="devlog-worker"
+        )
+
+    def run_db(self, func, *args, **kwargs) -> asyncio.Future:
+        """Run a blocking database call on the DB thread pool"""
+        return asyncio.get_running_loop().run_in_executor(
+            self._db_pool, functools.partial(func, *args, **kwargs)
+        )
+
+    def run_blocking(self, func, *args, **kwargs) -> asyncio.Future:
+        """Run other blocking work (web search, etc.) on the worker pool"""
+        return asyncio.get_running_loop().run_in_executor(
+            self._worker_pool, functools.partial(func, *args, **kwargs)
+        )
+
+    def _get_analyzer(self):
+        """Shared CodeAnalyzer (imported lazily to keep startup fast)"""
+        if self._analyzer is None:
+            from devlog.analysis.analyzer import CodeAnalyzer
+            self._analyzer = CodeAnalyzer()
+        return self._analyzer
+
+    def _get_searcher(self):
+        """Shared WebSearcher; reuse also keeps its in-memory result cache warm"""
+        if self._searcher is None:
+            from devlog.search.web_search import WebSearcher
+            self._searcher = WebSearcher()
+        return self._searcher
+
+    def _get_pipeline(self):
+        """Shared ReviewPipeline built on the same analyzer and searcher"""
+        if self._pipeline is None:
+            from devlog.analysis.review import ReviewPipeline
+            self._pipeline = ReviewPipeline(self._get_analyzer(), self._get_searcher())
+        return self._pipeline
+
+    async def _ollama_ready(self) -> bool:
+        """TTL-cached Ollama probe; a stale cache is refreshed off the event loop"""
+        checked_at, ok = _last_conn_check
+        if checked_at and time.monotonic() - checked_at < CONN_CHECK_TTL:
+            return ok
+        return await self.run_blocking(_cached_test_connection)
+
+    def on_unmount(self) -> None:
+        self._worker_pool.shutdown(wait=False, cancel_futures=True)
+        # Let an in-flight query finish before closing the shared connection
+        self._db_pool.shutdown(wait=True, cancel_futures=True)
+        _close_conn()
+
     def compose(self) -> ComposeResult:
         yield Header()
 
@@ -799,8 +1272,23 @@ class DevLogTUI(App):
         self.title = "DevLog - Code Review Assistant"
         self.sub_title = "Enhanced TUI"
 
-        # Check Ollama
-        if not test_connection():
+        # Shared helpers, created on first use and reused across actions
+        self._analyzer = None
+        self._searcher = None
+        self._pipeline = None
+
+        # Dashboard widgets used on hot paths (highlight, n/p navigation)
+        self._commit_list = self.query_one("#commit-list", CommitList)
+        self._code_viewer = self.query_one("#code-viewer", CodeViewer)
+        self._analysis_panel = self.query_one("#analysis-panel", AnalysisDisplay)
+
+        # Probe Ollama in the background so the first paint doesn't wait on it
+        self.probe_ollama()
+
+    @work(exclusive=True, group="ollama-probe")
+    async def probe_ollama(self) -> None:
+        """Warn once at startup if Ollama isn't reachable"""
+        if not await self._ollama_ready():
             self.notify(
                 "⚠️ Ollama not running - analysis features disabled",
                 severity="warning",
@@ -811,16 +1299,13 @@ class DevLogTUI(App):
         """Handle commit selection"""
         try:
             if event.list_view.id == "commit-list":
-                commit_list = self.query_one("#commit-list", CommitList)
-                commit = commit_list.get_selected_commit()
+                commit = self._commit_list.get_selected_commit()
 
                 if commit:
-                    code_viewer = self.query_one("#code-viewer", CodeViewer)
-                    code_viewer.show_commit_code(commit['short_hash'])
+                    self.preview_commit(self._code_viewer, commit['short_hash'])
 
                     # Clear previous analysis
-                    analysis = self.query_one("#analysis-panel", AnalysisDisplay)
-                    analysis.analysis = None
+                    self._analysis_panel.analysis = None
             
             elif event.list_view.id == "search-results-list":
                 commit_list = self.query_one("#search-results-list", CommitList)
@@ -828,11 +1313,19 @@ class DevLogTUI(App):
                 
                 if commit:
                     code_viewer = self.query_one("#search-code-viewer", CodeViewer)
-                    code_viewer.show_commit_code(commit['short_hash'])
+                    self.preview_commit(code_viewer, commit['short_hash'])
         except Exception as e:
             logger.error(f"Error in on_list_view_highlighted: {e}")
             self.app.notify(f"Error: {e}", severity="error")
 
+    @work(exclusive=True, group="preview")
+    async def preview_commit(self, code_viewer: CodeViewer, commit_hash: str) -> None:
+        """Load a commit into a code viewer, debounced while the highlight keeps moving"""
+        # A newer highlight cancels this worker during the sleep, so holding
+        # an arrow key only loads the commit the cursor stops on
+        await asyncio.sleep(PREVIEW_DEBOUNCE)
+        await code_viewer.show_commit_code(commit_hash)
+
     # ==================== ACTIONS ====================
 
     def action_switch_tab(self, tab_id: str) -> None:
@@ -843,30 +1336,36 @@ class DevLogTUI(App):
     @work(exclusive=True)
     async def action_analyze(self) -> None:
         """Analyze selected commit"""
-        try:
-            commit_list = self.query_one(CommitList)
-        except:
-            self.notify("No commit list available", severity="warning")
-            return
-
-        commit = commit_list.get_selected_commit()
+        commit = self._commit_list.get_selected_commit()
         if not commit:
             self.notify("No commit selected", severity="warning")
             return
 
-        if not test_connection():
+        if not await self._ollama_ready():
             self.notify("Ollama not running", severity="error")
             return
 
-        analysis_panel = self.query_one("#analysis-panel", AnalysisDisplay)
+        analysis_panel = self._analysis_panel
         analysis_panel.show_loading()
 
-        analyzer = CodeAnalyzer()
+        streamed = []
+        last_paint = 0.0
+
+        def on_progress(chunk: str) -> None:
+            # Tokens can arrive far faster than the terminal repaints, so
+            # coalesce them and redraw at most every ANALYSIS_PAINT_INTERVAL
+            nonlocal last_paint
+            streamed.append(chunk)
+            now = time.monotonic()
+            if now - last_paint >= ANALYSIS_PAINT_INTERVAL:
+                last_paint = now
+                analysis_panel.show_stream("".join(streamed))
 
         try:
-            result = await analyzer.analyze_commit(
+            result = await self._get_analyzer().analyze_commit(
                 commit['short_hash'],
-                'quick'
+                'quick',
+                on_progress=on_progress
             )
 
             if result:
@@ -897,12 +1396,12 @@ class DevLogTUI(App):
         review_workflow = self.query_one("#review-workflow", ReviewWorkflow)
         review_workflow.review_state = "running"
 
-        if not test_connection():
+        if not await self._ollama_ready():
             self.notify("Ollama not running", severity="error")
             review_workflow.review_state = "idle"
             return
 
-        pipeline = ReviewPipeline()
+        pipeline = self._get_pipeline()
 
         try:
             # Run review in background thread
@@ -943,29 +1442,19 @@ class DevLogTUI(App):
         widget = web_panel.query_one("#search-results", Static)
         widget.update("[yellow]⟳ Searching...[/]")
 
-        searcher = WebSearcher()
-
         try:
-            results = await asyncio.to_thread(searcher.search, query, 10)
-            web_panel.show_results(results)
+            results = await self.run_blocking(self._get_searcher().search, query, 10)
+            await web_panel.show_results(results)
         except Exception as e:
             widget.update(f"[red]Search failed:[/] {e}")
 
     def action_next_file(self) -> None:
         """Show next file in commit"""
-        try:
-            code_viewer = self.query_one("#code-viewer", CodeViewer)
-            code_viewer.next_file()
-        except:
-            pass
+        self._code_viewer.next_file()
 
     def action_prev_file(self) -> None:
         """Show previous file in commit"""
-        try:
-            code_viewer = self.query_one("#code-viewer", CodeViewer)
-            code_viewer.prev_file()
-        except:
-            pass
+        self._code_viewer.prev_file()
 
     def action_help(self) -> None:
         """Show help"""
@@ -994,6 +1483,13 @@ class DevLogTUI(App):
 
 def run_tui():
     """Entry point for enhanced TUI"""
+    # uvloop is optional; it lowers per-callback scheduling overhead when installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     app = DevLogTUI()
     app.run()
 
@@ -7,9 +7,8 @@ from textual.widgets import Header, Footer, Static, TextArea, Button, Label
 from textual.binding import Binding
 from textual import work
 from textual.events import Key
+from rich.text import Text
 import logging
-import pyperclip
-import asyncio
 
 from devlog.analysis.chat_manager import ChatManager
 from devlog.analysis.llm import test_connection
@@ -22,6 +21,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Streamed tokens are buffered and painted at most this often (~15 fps)
+STREAM_FLUSH_INTERVAL = 0.066
+
 
 class ChatPanel(Container):
     """Enhanced chatbot interface with tool support"""
@@ -36,7 +38,12 @@ class ChatPanel(Container):
         self.chat_manager = chat_manager
         self.ai_response_widget = None
         self.message_count = 0
-        self.last_ai_response_text = ""
+        # Current AI reply: the Text shown on screen, plus the raw chunks for copying
+        self._ai_text = None
+        self._ai_chunks = []
+        # Streamed chunks waiting for the next flush
+        self._pending_chunks = []
+        self._flush_timer = None
 
     def compose(self) -> ComposeResult:
         """Build the chat UI"""
@@ -57,22 +64,46 @@ class ChatPanel(Container):
 
     def on_mount(self) -> None:
         """Initialize chat"""
-        self.add_message("system", "👋 Hello! I'm DevLog Enhanced.")
-        self.add_message("system", "💡 I can search your commits, analyze code, and help with reviews.")
-        self.add_message("system", "🔍 Try asking: 'Show me my recent commits' or 'Search for authentication code'")
+        # Looked up once: add_message runs for every streamed flush
+        self._messages_area = self.query_one("#chat-messages-area", VerticalScroll)
+        self._input = self.query_one("#chat-input", TextArea)
+
+        self.add_system_messages([
+            "👋 Hello! I'm DevLog Enhanced.",
+            "💡 I can search your commits, analyze code, and help with reviews.",
+            "🔍 Try asking: 'Show me my recent commits' or 'Search for authentication code'",
+        ])
         self.call_after_refresh(self.focus_input)
 
     def focus_input(self) -> None:
         """Focus the input field"""
         try:
-            self.query_one("#chat-input", TextArea).focus()
+            self._input.focus()
         except Exception as e:
             logger.error(f"Failed to focus input: {e}")
 
+    @staticmethod
+    def _system_label(content: str) -> Label:
+        return Label(
+            f"[bold green]System:[/bold green] {content}",
+            classes="chat-message system-message",
+            markup=True
+        )
+
+    def add_system_messages(self, contents: list[str]) -> None:
+        """Add several system messages with one mount and one scroll"""
+        try:
+            messages_area = self._messages_area
+            self.message_count += len(contents)
+            messages_area.mount_all([self._system_label(content) for content in contents])
+            messages_area.scroll_end(animate=False)
+        except Exception as e:
+            logger.error(f"Error adding messages: {e}")
+
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the chat display"""
         try:
-            messages_area = self.query_one("#chat-messages-area", VerticalScroll)
+            messages_area = self._messages_area
             self.message_count += 1
 
             if role == "user":
@@ -86,44 +117,70 @@ class ChatPanel(Container):
                 self.ai_response_widget = None
 
             elif role == "system":
-                msg = Label(
-                    f"[bold green]System:[/bold green] {content}",
-                    classes="chat-message system-message",
-                    markup=True
-                )
-                messages_area.mount(msg)
+                messages_area.mount(self._system_label(content))
                 messages_area.scroll_end(animate=False)
 
             elif role == "ai_start":
+                self._ai_text = Text.assemble(("DevLog:", "bold magenta"), " ")
+                self._ai_chunks = []
+                # Tokens an interrupted reply never flushed belong to its bubble
+                self._pending_chunks = []
                 self.ai_response_widget = Label(
-                    "[bold magenta]DevLog:[/bold magenta] ",
-                    classes="chat-message ai-message",
-                    markup=True
+                    self._ai_text,
+                    classes="chat-message ai-message"
                 )
-                self.ai_response_widget._content_buffer = "[bold magenta]DevLog:[/bold magenta] "
-                self.last_ai_response_text = ""
 
                 messages_area.mount(self.ai_response_widget)
                 messages_area.scroll_end(animate=False)
 
+                if self._flush_timer is None:
+                    self._flush_timer = self.set_interval(STREAM_FLUSH_INTERVAL, self._flush_stream)
+
             elif role == "ai_stream":
                 if self.ai_response_widget:
-                    # Escape any markup characters in the streamed content
-                    escaped_content = content.replace("[", "\\[")
-                    self.ai_response_widget._content_buffer += escaped_content
-                    self.last_ai_response_text += content  # Store unescaped for copying
-                    self.ai_response_widget.update(self.ai_response_widget._content_buffer)
+                    # Appended as a plain span: no escaping, and the reply so
+                    # far is never re-parsed as markup
+                    self._ai_text.append(content)
+                    self._ai_chunks.append(content)
+                    self.ai_response_widget.update(self._ai_text)
                     messages_area.scroll_end(animate=False)
 
         except Exception as e:
             logger.error(f"Error adding message: {e}")
 
+    def _queue_chunk(self, chunk: str) -> None:
+        """Buffer a streamed chunk until the next flush"""
+        self._pending_chunks.append(chunk)
+
+    def _flush_stream(self) -> None:
+        """Paint everything buffered since the last flush as one update"""
+        if not self._pending_chunks:
+            return
+        chunks = self._pending_chunks
+        self._pending_chunks = []
+        # The text update and the scroll land in the same frame; Textual
+        # wraps each frame in synchronized output where the terminal has it
+        with self.app.batch_update():
+            self.add_message("ai_stream", "".join(chunks))
+
+    def _end_stream(self) -> None:
+        """Stop the flush timer and paint whatever is still buffered"""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self._flush_stream()
+
+    @property
+    def last_ai_response_text(self) -> str:
+        """Unformatted text of the latest AI reply"""
+        return "".join(self._ai_chunks)
+
     async def on_key(self, event: Key) -> None:
         """Handle key events for submission"""
         try:
             if event.key == "enter":
                 if not event.shift:
-                    if self.query_one("#chat-input", TextArea).has_focus:
+                    if self._input.has_focus:
                         event.prevent_default()
                         event.stop()
                         await self.submit_message()
@@ -136,7 +193,7 @@ class ChatPanel(Container):
 
     async def submit_message(self) -> None:
         """Submit message from TextArea"""
-        input_widget = self.query_one("#chat-input", TextArea)
+        input_widget = self._input
         message = input_widget.text.strip()
         if message:
             input_widget.text = ""
@@ -151,49 +208,54 @@ class ChatPanel(Container):
 
     def action_copy_last_response(self) -> None:
         """Copy the last AI response to clipboard"""
-        if self.last_ai_response_text:
-            try:
-                pyperclip.copy(self.last_ai_response_text)
-                self.app.notify("📋 Copied last response!", severity="information")
-            except Exception as e:
-                self.app.notify(f"Failed to copy: {e}", severity="error")
+        text = self.last_ai_response_text
+        if text:
+            self._copy_to_clipboard(text)
         else:
             self.app.notify("No response to copy yet.", severity="warning")
 
+    @work(thread=True, group="clipboard")
+    def _copy_to_clipboard(self, text: str) -> None:
+        """Copy off the UI thread (pyperclip shells out to xclip/pbcopy/...)"""
+        try:
+            # Imported on first copy: probing the clipboard backends slows startup
+            import pyperclip
+            pyperclip.copy(text)
+            self.app.call_from_thread(self.app.notify, "📋 Copied last response!", severity="information")
+        except Exception as e:
+            self.app.call_from_thread(self.app.notify, f"Failed to copy: {e}", severity="error")
+
     async def send_message(self, message: str) -> None:
         """Send a message and get AI response"""
         self.add_message("user", message)
         self.add_message("ai_start", "")
         self.get_ai_response(message)
 
-    @work(exclusive=True, thread=True)
-    def get_ai_response(self, message: str) -> None:
-        """Get AI response in background thread"""
+    @work(exclusive=True)
+    async def get_ai_response(self, message: str) -> None:
+        """Get AI response as a background task on the app's event loop"""
+        stream_widget = self.ai_response_widget
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            response_gen = self.chat_manager.send_message(message)
-
-            async def consume():
-                async for chunk in response_gen:
-                    self.app.call_from_thread(self.add_message, "ai_stream", chunk)
-
-            loop.run_until_complete(consume())
-            loop.close()
-
-            self.app.call_from_thread(self.focus_input)
+            # Buffered here and painted by the flush timer, not per token
+            async for chunk in self.chat_manager.send_message(message):
+                self._queue_chunk(chunk)
 
         except Exception as e:
             error_msg = f"Error: {str(e)}"
             logger.error(f"Chat error: {e}", exc_info=True)
-            self.app.call_from_thread(self.add_message, "system", f"❌ {error_msg}")
-            self.app.call_from_thread(self.focus_input)
+            self._end_stream()
+            self.add_message("system", f"❌ {error_msg}")
+        finally:
+            # Also runs when cancelled; a newer reply that cancelled this one
+            # owns the stream now, so only end it if it is still ours
+            if self.ai_response_widget is stream_widget:
+                self._end_stream()
+            self.focus_input()
 
     def action_clear_chat(self) -> None:
         """Clear chat history"""
         self.chat_manager.clear_history()
-        messages_area = self.query_one("#chat-messages-area", VerticalScroll)
+        messages_area = self._messages_area
         messages_area.remove_children()
         self.message_count = 0
         self.add_message("system", "Chat cleared. How can I help you?")
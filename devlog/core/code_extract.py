@@ -1,5 +1,7 @@
+import functools
 import re
-from typing import List, Dict, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from typing import Callable, List, Dict, Optional, Tuple
 
 def extract_functions_from_code(code: str, language: str) -> List[Dict]:
     """
@@ -11,6 +13,19 @@ def extract_functions_from_code(code: str, language: str) -> List[Dict]:
         - start_line: line number where function starts
         - end_line: line number where function ends
     """
+    # Callers may annotate the dicts, so hand out copies of the cached result
+    return [dict(func) for func in _extract_cached(code, language)]
+
+# One function_search parses up to limit * 3 (90 by default) blobs; room for a
+# few searches' worth so repeating or refining a query doesn't evict everything
+EXTRACT_CACHE_SIZE = 512
+
+@functools.lru_cache(maxsize=EXTRACT_CACHE_SIZE)
+def _extract_cached(code: str, language: str) -> Tuple[Dict, ...]:
+    """Parse once per (code, language); summaries and diff filtering reuse it"""
+    return tuple(_extract_uncached(code, language))
+
+def _extract_uncached(code: str, language: str) -> List[Dict]:
     if language == 'python':
         return extract_python_functions(code)
     elif language in ['javascript', 'typescript']:
@@ -30,168 +45,96 @@ def extract_functions_from_code(code: str, language: str) -> List[Dict]:
             'end_line': len(code.splitlines())
         }]
 
-def extract_python_functions(code: str) -> List[Dict]:
-    """Extract Python function and class definitions"""
-    functions = []
-    lines = code.splitlines()
-
-    # Regex for function/class definitions
-    func_pattern = re.compile(r'^(\s*)(def|class)\s+(\w+)')
-
-    i = 0
-    while i < len(lines):
-        match = func_pattern.match(lines[i])
-        if match:
-            indent = len(match.group(1))
-            func_type = match.group(2)  # 'def' or 'class'
-            name = match.group(3)
-
-            # Find the end of this function/class
-            start = i
-            i += 1
-
-            # Skip to next line with same or less indentation
-            while i < len(lines):
-                line = lines[i]
-                if line.strip() == '':
-                    i += 1
-                    continue
-
-                # Check indentation
-                current_indent = len(line) - len(line.lstrip())
-                if line.strip() and current_indent <= indent:
-                    break
-                i += 1
-
-            end = i
-            func_code = '\n'.join(lines[start:end])
-
-            functions.append({
-                'name': f"{func_type} {name}",
-                'code': func_code,
-                'start_line': start + 1,
-                'end_line': end
-            })
-        else:
-            i += 1
-
-    return functions
+# Definition patterns, compiled once at import. Each is anchored at the start
+# of a single line, so a non-matching line fails after a few characters.
+_PY_DEF = re.compile(r'^(\s*)(def|class)\s+(\w+)')
 
-def extract_js_functions(code: str) -> List[Dict]:
-    """Extract JavaScript/TypeScript functions"""
-    functions = []
-    lines = code.splitlines()
+# Patterns for different function styles
+_JS_FUNCS = [
+    re.compile(r'^\s*(function\s+\w+)'),           # function name()
+    re.compile(r'^\s*(const|let|var)\s+(\w+)\s*=\s*function'),  # const x = function
+    re.compile(r'^\s*(const|let|var)\s+(\w+)\s*=\s*\('),        # const x = () =>
+    re.compile(r'^\s*(async\s+)?(\w+)\s*\([^)]*\)\s*{'),        # method()
+]
 
-    # Patterns for different function styles
-    patterns = [
-        re.compile(r'^\s*(function\s+\w+)'),           # function name()
-        re.compile(r'^\s*(const|let|var)\s+(\w+)\s*=\s*function'),  # const x = function
-        re.compile(r'^\s*(const|let|var)\s+(\w+)\s*=\s*\('),        # const x = () =>
-        re.compile(r'^\s*(async\s+)?(\w+)\s*\([^)]*\)\s*{'),        # method()
-    ]
+_JAVA_DEF = re.compile(r'^\s*(public|private|protected)?\s*(static)?\s*(class|\w+)\s+(\w+)\s*[\(\{]')
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        matched = False
+# Simple pattern for C function definitions
+# This won't catch all cases but works for common patterns
+_C_FUNC = re.compile(r'^\s*[\w\*\s]+\s+(\w+)\s*\([^)]*\)\s*{')
 
-        for pattern in patterns:
-            match = pattern.search(line)
-            if match:
-                start = i
-                name = match.group(1) if len(match.groups()) == 1 else match.group(2)
+_GO_FUNC = re.compile(r'^\s*func\s+(\w+|\(\w+\s+\*?\w+\)\s+\w+)\s*\(')
 
-                # Find matching closing brace
-                brace_count = line.count('{') - line.count('}')
-                i += 1
 
-                while i < len(lines) and brace_count > 0:
-                    brace_count += lines[i].count('{') - lines[i].count('}')
-                    i += 1
+def _brace_block_end(lines: List[str], start: int) -> int:
+    """Index just past the {...} block whose header is lines[start]"""
+    brace_count = lines[start].count('{') - lines[start].count('}')
+    i = start + 1
 
-                end = i
-                func_code = '\n'.join(lines[start:end])
+    while i < len(lines) and brace_count > 0:
+        brace_count += lines[i].count('{') - lines[i].count('}')
+        i += 1
 
-                functions.append({
-                    'name': name,
-                    'code': func_code,
-                    'start_line': start + 1,
-                    'end_line': end
-                })
-                matched = True
-                break
+    return i
 
-        if not matched:
-            i += 1
 
-    return functions
+def _extract_blocks(code: str, match_header: Callable[[str], Optional[str]]) -> List[Dict]:
+    """Extract a {...} block for each header line; headers inside a block are skipped
 
-def extract_java_functions(code: str) -> List[Dict]:
-    """Extract Java methods and classes"""
+    match_header(line) returns the block name, or None if the line isn't a header.
+    """
     functions = []
     lines = code.splitlines()
 
-    # Pattern for methods and classes
-    pattern = re.compile(r'^\s*(public|private|protected)?\s*(static)?\s*(class|\w+)\s+(\w+)\s*[\(\{]')
-
     i = 0
     while i < len(lines):
-        match = pattern.search(lines[i])
-        if match:
-            name = match.group(4)
-            start = i
-
-            # Find matching closing brace
-            brace_count = lines[i].count('{') - lines[i].count('}')
+        name = match_header(lines[i])
+        if name is None:
             i += 1
+            continue
 
-            while i < len(lines) and brace_count > 0:
-                brace_count += lines[i].count('{') - lines[i].count('}')
-                i += 1
-
-            end = i
-            func_code = '\n'.join(lines[start:end])
-
-            functions.append({
-                'name': name,
-                'code': func_code,
-                'start_line': start + 1,
-                'end_line': end
-            })
-        else:
-            i += 1
+        start = i
+        i = _brace_block_end(lines, start)
+        functions.append({
+            'name': name,
+            'code': '\n'.join(lines[start:i]),
+            'start_line': start + 1,
+            'end_line': i
+        })
 
     return functions
 
-def extract_c_functions(code: str) -> List[Dict]:
-    """Extract C/C++ functions"""
+def extract_python_functions(code: str) -> List[Dict]:
+    """Extract Python function and class definitions"""
     functions = []
     lines = code.splitlines()
-
-    # Simple pattern for function definitions
-    # This won't catch all cases but works for common patterns
-    pattern = re.compile(r'^\s*[\w\*\s]+\s+(\w+)\s*\([^)]*\)\s*{')
+    match_def = _PY_DEF.match
 
     i = 0
     while i < len(lines):
-        match = pattern.search(lines[i])
+        match = match_def(lines[i])
         if match:
-            name = match.group(1)
-            start = i
+            indent = len(match.group(1))
+            func_type = match.group(2)  # 'def' or 'class'
+            name = match.group(3)
 
-            # Find matching closing brace
-            brace_count = lines[i].count('{') - lines[i].count('}')
+            # Find the end of this function/class
+            start = i
             i += 1
 
-            while i < len(lines) and brace_count > 0:
-                brace_count += lines[i].count('{') - lines[i].count('}')
+            # Skip to next line with same or less indentation (blank lines never end it)
+            while i < len(lines):
+                line = lines[i]
+                body = line.lstrip()
+                if body and len(line) - len(body) <= indent:
+                    break
                 i += 1
 
             end = i
             func_code = '\n'.join(lines[start:end])
 
             functions.append({
-                'name': name,
+                'name': f"{func_type} {name}",
                 'code': func_code,
                 'start_line': start + 1,
                 'end_line': end
@@ -201,41 +144,51 @@ def extract_c_functions(code: str) -> List[Dict]:
 
     return functions
 
-def extract_go_functions(code: str) -> List[Dict]:
-    """Extract Go functions"""
-    functions = []
-    lines = code.splitlines()
-
-    pattern = re.compile(r'^\s*func\s+(\w+|\(\w+\s+\*?\w+\)\s+\w+)\s*\(')
-
-    i = 0
-    while i < len(lines):
-        match = pattern.search(lines[i])
+def _match_js_header(line: str) -> Optional[str]:
+    for pattern in _JS_FUNCS:
+        match = pattern.search(line)
         if match:
-            name = match.group(1)
-            start = i
+            return match.group(1) if len(match.groups()) == 1 else match.group(2)
+    return None
+
+def _match_java_header(line: str) -> Optional[str]:
+    # Every header has a '(' or '{'; the substring test is far cheaper than the regex
+    if '(' not in line and '{' not in line:
+        return None
+    match = _JAVA_DEF.search(line)
+    return match.group(4) if match else None
+
+def _match_c_header(line: str) -> Optional[str]:
+    # The pattern backtracks heavily, so only try lines that can possibly match
+    if '{' not in line or '(' not in line:
+        return None
+    match = _C_FUNC.search(line)
+    return match.group(1) if match else None
+
+def _match_go_header(line: str) -> Optional[str]:
+    match = _GO_FUNC.search(line)
+    return match.group(1) if match else None
 
-            # Find matching closing brace
-            brace_count = lines[i].count('{') - lines[i].count('}')
-            i += 1
+def extract_js_functions(code: str) -> List[Dict]:
+    """Extract JavaScript/TypeScript functions"""
+    return _extract_blocks(code, _match_js_header)
 
-            while i < len(lines) and brace_count > 0:
-                brace_count += lines[i].count('{') - lines[i].count('}')
-                i += 1
+def extract_java_functions(code: str) -> List[Dict]:
+    """Extract Java methods and classes"""
+    return _extract_blocks(code, _match_java_header)
 
-            end = i
-            func_code = '\n'.join(lines[start:end])
+def extract_c_functions(code: str) -> List[Dict]:
+    """Extract C/C++ functions"""
+    return _extract_blocks(code, _match_c_header)
 
-            functions.append({
-                'name': name,
-                'code': func_code,
-                'start_line': start + 1,
-                'end_line': end
-            })
-        else:
-            i += 1
+def extract_go_functions(code: str) -> List[Dict]:
+    """Extract Go functions"""
+    return _extract_blocks(code, _match_go_header)
 
-    return functions
+# Hunk header: @@ -old_start,old_count +new_start,new_count @@
+# Starting with the literal '@@' lets the regex engine jump between hunks
+# instead of the code visiting every line of the diff.
+_HUNK_HEADER = re.compile(r'@@[^\n]*?\+(\d+),?(\d+)?')
 
 def extract_changed_functions(diff_text: str, code_after: str, language: str) -> List[Dict]:
     """
@@ -249,17 +202,27 @@ def extract_changed_functions(diff_text: str, code_after: str, language: str) ->
     Returns:
         List of changed functions with context
     """
-    # Parse diff to find changed line numbers
-    changed_lines = set()
-
-    for line in diff_text.splitlines():
-        if line.startswith('@@'):
-            # Parse hunk header: @@ -old_start,old_count +new_start,new_count @@
-            match = re.search(r'\+(\d+),?(\d+)?', line)
-            if match:
-                start = int(match.group(1))
-                count = int(match.group(2)) if match.group(2) else 1
-                changed_lines.update(range(start, start + count))
+    # Parse diff to find changed line ranges, as inclusive (first, last) pairs
+    hunks = []
+
+    for match in _HUNK_HEADER.finditer(diff_text):
+        # Only '@@' at the start of a line begins a hunk header
+        if match.start() and diff_text[match.start() - 1] != '\n':
+            continue
+        start = int(match.group(1))
+        count = int(match.group(2)) if match.group(2) else 1
+        if count > 0:
+            hunks.append((start, start + count - 1))
+
+    # Merge into sorted, disjoint intervals so both ends can be bisected
+    merged = []
+    for first, last in sorted(hunks):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    firsts = [first for first, _ in merged]
+    lasts = [last for _, last in merged]
 
     # Extract all functions
     all_functions = extract_functions_from_code(code_after, language)
@@ -267,9 +230,15 @@ def extract_changed_functions(diff_text: str, code_after: str, language: str) ->
     # Filter to only functions that overlap with changed lines
     changed_functions = []
     for func in all_functions:
-        func_lines = set(range(func['start_line'], func['end_line'] + 1))
-        if func_lines & changed_lines:  # Intersection
-            func['changed_lines'] = sorted(func_lines & changed_lines)
+        lo, hi = func['start_line'], func['end_line']
+        # Hunks ending at or after lo and starting at or before hi overlap the function
+        overlapping = merged[bisect_left(lasts, lo):bisect_right(firsts, hi)]
+        if overlapping:
+            func['changed_lines'] = [
+                line
+                for first, last in overlapping
+                for line in range(max(first, lo), min(last, hi) + 1)
+            ]
             changed_functions.append(func)
 
     return changed_functions
@@ -1,109 +1,424 @@
 import sqlite3
 import os
+import threading
+import json
+import re
+import zlib
+from array import array
+from collections import defaultdict
+from typing import Optional
 from devlog.paths import DB_PATH, DB_DIR
 from datetime import datetime
 
+# Bump whenever _SCHEMA or the FTS setup changes, so existing databases
+# run init_db's DDL again instead of taking the fast path
+SCHEMA_VERSION = 8
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS tracked_repos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        repo_name TEXT NOT NULL,
+        repo_path TEXT NOT NULL UNIQUE,
+        tracked_since TEXT NOT NULL,
+        last_commit_at TEXT,
+        commit_count INTEGER DEFAULT 0,
+        active BOOLEAN DEFAULT 1
+    );
+
+    CREATE TABLE IF NOT EXISTS git_commits (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        repo_id INTEGER NOT NULL,
+        commit_hash TEXT NOT NULL,
+        short_hash TEXT NOT NULL,
+        message TEXT NOT NULL,
+        author TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        branch TEXT,
+        files_changed INTEGER DEFAULT 0,
+        insertions INTEGER DEFAULT 0,
+        deletions INTEGER DEFAULT 0,
+        FOREIGN KEY(repo_id) REFERENCES tracked_repos(id),
+        UNIQUE(repo_id, commit_hash)
+    );
+
+    -- Code changes (diffs)
+    CREATE TABLE IF NOT EXISTS code_changes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        commit_id INTEGER NOT NULL,
+        file_path TEXT NOT NULL,
+        change_type TEXT NOT NULL,
+        language TEXT,
+        diff_text TEXT,
+        code_before TEXT,
+        code_after TEXT,
+        lines_added INTEGER DEFAULT 0,
+        lines_removed INTEGER DEFAULT 0,
+        FOREIGN KEY(commit_id) REFERENCES git_commits(id)
+    );
+
+    -- AI analysis cache
+    CREATE TABLE IF NOT EXISTS analyses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        commit_id INTEGER NOT NULL,
+        analysis_type TEXT NOT NULL,
+        summary TEXT,
+        issues TEXT,
+        suggestions TEXT,
+        patterns TEXT,
+        analyzed_at TEXT NOT NULL,
+        FOREIGN KEY(commit_id) REFERENCES git_commits(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS reviews (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        topic TEXT NOT NULL,
+        commits_analyzed TEXT,
+        your_code TEXT,
+        web_sources TEXT,
+        comparison TEXT,
+        recommendations TEXT,
+        created_at TEXT NOT NULL
+    );
+
+    -- Raw float32 vectors (see embeddings.py)
+    CREATE TABLE IF NOT EXISTS commit_embeddings (
+        commit_id INTEGER PRIMARY KEY,
+        embedding BLOB NOT NULL,
+        FOREIGN KEY(commit_id) REFERENCES git_commits(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS commit_tags (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        commit_id INTEGER NOT NULL,
+        tag TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY(commit_id) REFERENCES git_commits(id),
+        UNIQUE(commit_id, tag)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_commits_timestamp ON git_commits(timestamp);
+    CREATE INDEX IF NOT EXISTS idx_commits_repo_ts ON git_commits(repo_id, timestamp DESC);
+    -- Covers the per-commit file listings and the commit/language join
+    CREATE INDEX IF NOT EXISTS idx_changes_commit_cover
+        ON code_changes(commit_id, language, file_path, change_type, lines_added, lines_removed);
+    -- commit_hash LIKE 'prefix%' can only use an index with LIKE's NOCASE collation
+    CREATE INDEX IF NOT EXISTS idx_commits_hash ON git_commits(commit_hash COLLATE NOCASE);
+    CREATE INDEX IF NOT EXISTS idx_commits_short_hash ON git_commits(short_hash);
+    CREATE INDEX IF NOT EXISTS idx_analyses_commit_type ON analyses(commit_id, analysis_type);
+    CREATE INDEX IF NOT EXISTS idx_changes_language ON code_changes(language);
+    CREATE INDEX IF NOT EXISTS idx_tags_commit ON commit_tags(commit_id);
+    CREATE INDEX IF NOT EXISTS idx_tags_tag_commit ON commit_tags(tag, commit_id);
+    -- Covers the "JOIN tracked_repos r ... WHERE r.active = 1" every search does,
+    -- including the repo_name it selects, with active repos only
+    CREATE INDEX IF NOT EXISTS idx_tracked_repos_active ON tracked_repos(id, repo_name) WHERE active = 1;
+
+    -- Superseded by the composite indexes above (same leading column)
+    DROP INDEX IF EXISTS idx_commits_repo;
+    DROP INDEX IF EXISTS idx_changes_commit;
+    DROP INDEX IF EXISTS idx_tracked_active;
+    DROP INDEX IF EXISTS idx_changes_commit_lang;
+    DROP INDEX IF EXISTS idx_tags_tag;
+"""
+
 def init_db():
     os.makedirs(DB_DIR, exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
     c = conn.cursor()
 
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS tracked_repos (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            repo_name TEXT NOT NULL,
-            repo_path TEXT NOT NULL UNIQUE,
-            tracked_since TEXT NOT NULL,
-            last_commit_at TEXT,
-            commit_count INTEGER DEFAULT 0,
-            active BOOLEAN DEFAULT 1
-        );
-    """)
-
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS git_commits (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            repo_id INTEGER NOT NULL,
-            commit_hash TEXT NOT NULL,
-            short_hash TEXT NOT NULL,
-            message TEXT NOT NULL,
-            author TEXT NOT NULL,
-            timestamp TEXT NOT NULL,
-            branch TEXT,
-            files_changed INTEGER DEFAULT 0,
-            insertions INTEGER DEFAULT 0,
-            deletions INTEGER DEFAULT 0,
-            FOREIGN KEY(repo_id) REFERENCES tracked_repos(id),
-            UNIQUE(repo_id, commit_hash)
-        );
-    """)
-
-    # Code changes (diffs)
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS code_changes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            commit_id INTEGER NOT NULL,
-            file_path TEXT NOT NULL,
-            change_type TEXT NOT NULL,
-            language TEXT,
-            diff_text TEXT,
-            code_before TEXT,
-            code_after TEXT,
-            lines_added INTEGER DEFAULT 0,
-            lines_removed INTEGER DEFAULT 0,
-            FOREIGN KEY(commit_id) REFERENCES git_commits(id)
-        );
-    """)
-
-    # AI analysis cache
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS analyses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            commit_id INTEGER NOT NULL,
-            analysis_type TEXT NOT NULL,
-            summary TEXT,
-            issues TEXT,
-            suggestions TEXT,
-            patterns TEXT,
-            analyzed_at TEXT NOT NULL,
-            FOREIGN KEY(commit_id) REFERENCES git_commits(id)
-        );
-    """)
-
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS reviews (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            topic TEXT NOT NULL,
-            commits_analyzed TEXT,
-            your_code TEXT,
-            web_sources TEXT,
-            comparison TEXT,
-            recommendations TEXT,
-            created_at TEXT NOT NULL
-        );
-    """)
-
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS commit_tags (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            commit_id INTEGER NOT NULL,
-            tag TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            FOREIGN KEY(commit_id) REFERENCES git_commits(id),
-            UNIQUE(commit_id, tag)
-        );
-    """)
-
-    c.execute("CREATE INDEX IF NOT EXISTS idx_commits_repo ON git_commits(repo_id)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_commits_timestamp ON git_commits(timestamp)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_changes_commit ON code_changes(commit_id)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_changes_language ON code_changes(language)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_tags_commit ON commit_tags(commit_id)")
-    c.execute("CREATE INDEX IF NOT EXISTS idx_tags_tag ON commit_tags(tag)")
+    # Already initialized: one PRAGMA read instead of re-running all the DDL
+    if c.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        conn.close()
+        return
+
+    c.executescript(_SCHEMA)
+
+    _init_commits_fts(c)
+    init_code_changes_fts(c)
+    _migrate_json_embeddings(c)
 
+    c.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
     conn.close()
 
-def get_connection():
-    """Get database connection"""
-    return sqlite3.connect(DB_PATH)
+def _migrate_json_embeddings(c):
+    """Convert embeddings stored as JSON text by older versions to float32 BLOBs"""
+    c.execute("SELECT commit_id, embedding FROM commit_embeddings WHERE typeof(embedding) = 'text'")
+    rows = c.fetchall()
+    c.executemany(
+        "UPDATE commit_embeddings SET embedding = ? WHERE commit_id = ?",
+        [(array('f', json.loads(embedding)).tobytes(), commit_id) for commit_id, embedding in rows]
+    )
+
+# Porter stemming so "fixes" finds "fixed"; 2/3-character prefix indexes back
+# the prefix-matched terms search builds
+_COMMITS_FTS_TABLE_SQL = """
+    CREATE VIRTUAL TABLE commits_fts USING fts5(
+        message,
+        author,
+        content='git_commits',
+        content_rowid='id',
+        tokenize='porter unicode61',
+        prefix='2 3'
+    )
+"""
+
+_COMMITS_FTS_TRIGGERS = {
+    "git_commits_ai": """
+        CREATE TRIGGER git_commits_ai AFTER INSERT ON git_commits BEGIN
+            INSERT INTO commits_fts(rowid, message, author) VALUES (new.id, new.message, new.author);
+        END
+    """,
+    "git_commits_ad": """
+        CREATE TRIGGER git_commits_ad AFTER DELETE ON git_commits BEGIN
+            INSERT INTO commits_fts(commits_fts, rowid, message, author)
+            VALUES ('delete', old.id, old.message, old.author);
+        END
+    """,
+    "git_commits_au": """
+        CREATE TRIGGER git_commits_au AFTER UPDATE OF message, author ON git_commits BEGIN
+            INSERT INTO commits_fts(commits_fts, rowid, message, author)
+            VALUES ('delete', old.id, old.message, old.author);
+            INSERT INTO commits_fts(rowid, message, author) VALUES (new.id, new.message, new.author);
+        END
+    """,
+}
+
+def _init_commits_fts(c):
+    """Create the FTS5 index over commit messages and authors (skipped if FTS5 is unavailable)"""
+    c.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='commits_fts'")
+    row = c.fetchone()
+    if row and "porter" in row[0]:
+        return
+
+    if row:
+        # Message-only index from an earlier version; rebuilt below
+        for name in _COMMITS_FTS_TRIGGERS:
+            c.execute(f"DROP TRIGGER IF EXISTS {name}")
+        c.execute("DROP TABLE commits_fts")
+
+    try:
+        c.execute(_COMMITS_FTS_TABLE_SQL)
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5 - search falls back to LIKE
+        return
+
+    # Keep the index in sync with git_commits
+    for name, sql in _COMMITS_FTS_TRIGGERS.items():
+        c.execute(f"DROP TRIGGER IF EXISTS {name}")
+        c.execute(sql)
+
+    # Index commits captured before the table existed
+    c.execute("INSERT INTO commits_fts(commits_fts) VALUES ('rebuild')")
+
+# trigram makes substring/identifier search index-backed (SQLite >= 3.34);
+# porter is the fallback for older builds
+TRIGRAM_MIN_VERSION = (3, 34, 0)
+TOKENIZERS = ("trigram", "porter unicode61")
+
+_CODE_FTS_TABLE_SQL = """
+    CREATE VIRTUAL TABLE code_changes_fts USING fts5(
+        commit_id UNINDEXED,
+        file_path,
+        code_after,
+        diff_text,
+        language UNINDEXED,
+        content='code_changes',
+        content_rowid='id',
+        tokenize='{tokenizer}'
+    )
+"""
+
+# External-content sync: rows are removed with the 'delete' command (a plain
+# DELETE would read the already-changed content) and inserted with their id
+_CODE_FTS_TRIGGERS = {
+    "code_changes_ai": """
+        CREATE TRIGGER code_changes_ai AFTER INSERT ON code_changes BEGIN
+            INSERT INTO code_changes_fts(rowid, commit_id, file_path, code_after, diff_text, language)
+            VALUES (new.id, new.commit_id, new.file_path, new.code_after, new.diff_text, new.language);
+        END
+    """,
+    "code_changes_ad": """
+        CREATE TRIGGER code_changes_ad AFTER DELETE ON code_changes BEGIN
+            INSERT INTO code_changes_fts(code_changes_fts, rowid, commit_id, file_path, code_after, diff_text, language)
+            VALUES ('delete', old.id, old.commit_id, old.file_path, old.code_after, old.diff_text, old.language);
+        END
+    """,
+    # Only reindex when an FTS column changes, not on metadata-only updates
+    "code_changes_au": """
+        CREATE TRIGGER code_changes_au
+        AFTER UPDATE OF commit_id, file_path, code_after, diff_text, language ON code_changes BEGIN
+            INSERT INTO code_changes_fts(code_changes_fts, rowid, commit_id, file_path, code_after, diff_text, language)
+            VALUES ('delete', old.id, old.commit_id, old.file_path, old.code_after, old.diff_text, old.language);
+            INSERT INTO code_changes_fts(rowid, commit_id, file_path, code_after, diff_text, language)
+            VALUES (new.id, new.commit_id, new.file_path, new.code_after, new.diff_text, new.language);
+        END
+    """,
+}
+
+# FTS5's tokenizer when CREATE VIRTUAL TABLE doesn't name one
+DEFAULT_FTS_TOKENIZER = "unicode61"
+
+_TOKENIZE_OPTION = re.compile(r"""tokenize\s*=\s*(?:'([^']*)'|"([^"]*)")""", re.IGNORECASE)
+
+def code_fts_tokenizer(c):
+    """Tokenizer of the code_changes_fts index, or None if it doesn't exist"""
+    c.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='code_changes_fts'")
+    row = c.fetchone()
+    if not row:
+        return None
+    match = _TOKENIZE_OPTION.search(row[0])
+    if not match:
+        return DEFAULT_FTS_TOKENIZER
+    return " ".join((match.group(1) or match.group(2)).split())
+
+def _preferred_code_tokenizer(c):
+    """First of TOKENIZERS this SQLite can build, or None without FTS5"""
+    candidates = TOKENIZERS
+    if sqlite3.sqlite_version_info < TRIGRAM_MIN_VERSION:
+        candidates = TOKENIZERS[1:]
+    for candidate in candidates:
+        try:
+            c.execute(f"CREATE VIRTUAL TABLE temp.code_fts_probe USING fts5(x, tokenize='{candidate}')")
+            c.execute("DROP TABLE temp.code_fts_probe")
+            return candidate
+        except sqlite3.OperationalError:
+            continue
+    return None
+
+def init_code_changes_fts(c):
+    """Create (or resync) the FTS5 index over code_changes content
+
+    An index built with another tokenizer (e.g. by older versions) is
+    rebuilt with the preferred one. Returns the tokenizer in use, or None
+    if SQLite was built without FTS5.
+    """
+    tokenizer = _preferred_code_tokenizer(c)
+    if tokenizer is None:
+        # No FTS5 - code search falls back to LIKE
+        return None
+
+    current = code_fts_tokenizer(c)
+    if current != tokenizer:
+        if current is not None:
+            for name in _CODE_FTS_TRIGGERS:
+                c.execute(f"DROP TRIGGER IF EXISTS {name}")
+            c.execute("DROP TABLE code_changes_fts")
+        c.execute(_CODE_FTS_TABLE_SQL.format(tokenizer=tokenizer))
+
+    # Replaces triggers from earlier versions of this index
+    for name, sql in _CODE_FTS_TRIGGERS.items():
+        c.execute(f"DROP TRIGGER IF EXISTS {name}")
+        c.execute(sql)
+
+    # Bulk-load from code_changes in one pass (also realigns rowids with ids),
+    # then merge the index b-trees
+    c.execute("INSERT INTO code_changes_fts(code_changes_fts) VALUES ('rebuild')")
+    c.execute("INSERT INTO code_changes_fts(code_changes_fts) VALUES ('optimize')")
+    return tokenizer
+
+def has_commits_fts(c) -> bool:
+    """Check whether the commits_fts index exists (older DBs may lack it)"""
+    c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='commits_fts'")
+    return c.fetchone() is not None
+
+def fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query: every term quoted and prefix-matched"""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"*' for term in terms)
+
+def code_fts_query(c, query: str, columns: str = "code_after diff_text",
+                   substring_only: bool = False) -> Optional[str]:
+    """FTS5 expression matching query in the given code_changes_fts columns
+
+    Returns None when the caller should use LIKE instead. With substring_only,
+    token-based (non-trigram) indexes are skipped, as they miss matches inside
+    longer identifiers.
+    """
+    if not query or not query.strip():
+        return None
+
+    tokenizer = code_fts_tokenizer(c)
+    if tokenizer is None:
+        return None
+    if tokenizer.split()[0] == "trigram":
+        # A quoted trigram phrase is a case-insensitive substring match, like
+        # LIKE '%query%', but needs at least 3 characters to hit the index
+        if len(query) < 3:
+            return None
+        return f'{{{columns}}}: "' + query.replace('"', '""') + '"'
+    if substring_only:
+        return None
+    return f"{{{columns}}}: " + fts_query(query)
+
+def attach_changed_files(conn, results):
+    """Set result['files'] on each search result (keyed by 'commit_id') in one query"""
+    files_by_commit = defaultdict(list)
+    if results:
+        commit_ids = [result['commit_id'] for result in results]
+        c = conn.cursor()
+        c.row_factory = sqlite3.Row
+        c.execute(f"""
+            SELECT commit_id, file_path, change_type, language, lines_added, lines_removed
+            FROM code_changes
+            WHERE commit_id IN ({','.join('?' * len(commit_ids))})
+            ORDER BY id
+        """, commit_ids)
+        for row in c.fetchall():
+            file_info = dict(row)
+            files_by_commit[file_info.pop('commit_id')].append(file_info)
+
+    for result in results:
+        result['files'] = files_by_commit[result['commit_id']]
+
+# journal_mode=WAL is persisted in the database file, so it only needs
+# setting once per process; the rest are per-connection
+_wal_enabled = False
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+def get_connection(**kwargs):
+    """Get database connection (kwargs go to sqlite3.connect)"""
+    global _wal_enabled
+    conn = sqlite3.connect(DB_PATH, **kwargs)
+    if not _wal_enabled:
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            _wal_enabled = True
+        except sqlite3.OperationalError:
+            # Database locked by another writer - retry on the next connection
+            pass
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+# Per-thread connections reused across calls by search and tags, so their
+# short queries don't each pay for a connect, schema load and PRAGMAs
+_local = threading.local()
+
+def get_conn():
+    """This thread's shared connection; callers use it but never close it"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = get_connection()
+    return conn
+
+# code_before is stored compressed: it is only kept for history and is never
+# searched, so it doesn't need to stay as plain TEXT
+COMPRESS_LEVEL = 6
+
+def compress_text(text):
+    """Compress text for storage in a BLOB-valued column"""
+    if not text:
+        return text
+    return zlib.compress(text.encode('utf-8'), COMPRESS_LEVEL)
+
+def decompress_text(value):
+    """Inverse of compress_text (plain TEXT from older rows passes through)"""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode('utf-8')
+    return value
@@ -1,8 +1,8 @@
 """
 Database Migration - Add FTS5 Full-Text Search Support
 
-Run this once to enable fast full-text search in code content.
-This is OPTIONAL - the system works without it, but this makes it faster.
+init_db now sets this up on its own; running this is only needed to
+rebuild the code search index by hand.
 
 Usage:
     python -m devlog.core.db_migration
@@ -10,6 +10,7 @@ Usage:
 
 import sqlite3
 from devlog.paths import DB_PATH
+from devlog.core.db import init_code_changes_fts
 
 
 def add_fts5_search():
@@ -38,56 +39,16 @@ def add_fts5_search():
     print("Creating FTS5 table for code search...")
 
     try:
-        # Create FTS5 virtual table
-        c.execute("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS code_changes_fts USING fts5(
-                commit_id UNINDEXED,
-                file_path,
-                code_after,
-                diff_text,
-                language UNINDEXED,
-                content='code_changes',
-                content_rowid='id'
-            )
-        """)
-
-        print("✓ FTS5 table created")
-
-        # Populate FTS5 table with existing data
-        print("Populating FTS5 index with existing code...")
-        c.execute("""
-            INSERT INTO code_changes_fts(commit_id, file_path, code_after, diff_text, language)
-            SELECT commit_id, file_path, code_after, diff_text, language
-            FROM code_changes
-            WHERE code_after IS NOT NULL OR diff_text IS NOT NULL
-        """)
-
-        rows_indexed = c.rowcount
-        print(f"✓ Indexed {rows_indexed} code changes")
+        # Table, sync triggers and the initial bulk load
+        tokenizer = init_code_changes_fts(c)
+        if tokenizer is None:
+            raise sqlite3.OperationalError("no FTS5 tokenizer available")
+
+        print(f"✓ FTS5 table created (tokenizer: {tokenizer})")
 
-        # Create triggers to keep FTS5 in sync
-        print("Creating triggers to keep FTS5 updated...")
-
-        c.execute("""
-            CREATE TRIGGER IF NOT EXISTS code_changes_ai AFTER INSERT ON code_changes BEGIN
-                INSERT INTO code_changes_fts(commit_id, file_path, code_after, diff_text, language)
-                VALUES (new.commit_id, new.file_path, new.code_after, new.diff_text, new.language);
-            END
-        """)
-
-        c.execute("""
-            CREATE TRIGGER IF NOT EXISTS code_changes_ad AFTER DELETE ON code_changes BEGIN
-                DELETE FROM code_changes_fts WHERE rowid = old.id;
-            END
-        """)
-
-        c.execute("""
-            CREATE TRIGGER IF NOT EXISTS code_changes_au AFTER UPDATE ON code_changes BEGIN
-                DELETE FROM code_changes_fts WHERE rowid = old.id;
-                INSERT INTO code_changes_fts(commit_id, file_path, code_after, diff_text, language)
-                VALUES (new.commit_id, new.file_path, new.code_after, new.diff_text, new.language);
-            END
-        """)
+        c.execute("SELECT COUNT(*) FROM code_changes")
+        rows_indexed = c.fetchone()[0]
+        print(f"✓ Indexed {rows_indexed} code changes")
 
         print("✓ Triggers created")
 
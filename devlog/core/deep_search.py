@@ -7,32 +7,69 @@ Provides 3 search modes:
 3. Semantic search (understands meaning via embeddings)
 """
 
+import heapq
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from devlog.paths import DB_PATH
 from devlog.core.embeddings import semantic_search as embeddings_semantic_search, generate_embedding
 from devlog.core.code_extract import extract_functions_from_code
+from devlog.core.db import (
+    attach_changed_files, code_fts_query, fts_query, get_connection, has_commits_fts
+)
 import re
 
+# Checked in order, so 'function x' wins over a 'def y' earlier in the query
+_FUNCTION_NAME_PATTERNS = [
+    re.compile(r'function\s+(\w+)'),
+    re.compile(r'method\s+(\w+)'),
+    re.compile(r'class\s+(\w+)'),
+    re.compile(r'def\s+(\w+)'),
+]
+_IDENTIFIER = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+# search_all runs at most this many searches side by side
+SEARCH_WORKERS = 4
+
 
 class DeepSearch:
     """Advanced search combining multiple strategies"""
 
     def __init__(self):
-        self.conn = None
+        # One connection per thread, since search_all runs searches in parallel
+        self._local = threading.local()
+        self._conns = []
+        self._conns_lock = threading.Lock()
+        # Reused across search_all calls, so its threads (and their
+        # connections) are too; threads only start on first use
+        self._pool = self._new_pool()
+
+    @staticmethod
+    def _new_pool() -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="deep-search")
 
     def _get_connection(self):
-        """Get database connection"""
-        if not self.conn:
-            self.conn = sqlite3.connect(DB_PATH)
-            self.conn.row_factory = sqlite3.Row
-        return self.conn
+        """Get this thread's database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Only ever used by the creating thread; close() may run elsewhere
+            conn = get_connection(check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
 
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """Close database connections"""
+        # Workers first, so none is still using a connection
+        self._pool.shutdown(wait=True)
+        self._pool = self._new_pool()
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
 
     # ==================== KEYWORD SEARCH ====================
 
@@ -50,7 +87,14 @@ class DeepSearch:
         where_clauses = ["r.active = 1"]
         params = []
 
-        if query:
+        if query and query.strip() and has_commits_fts(c):
+            # Message matches come from the FTS index instead of a LIKE scan
+            where_clauses.append(
+                "(c.id IN (SELECT rowid FROM commits_fts WHERE commits_fts MATCH ?)"
+                " OR cc.file_path LIKE ?)"
+            )
+            params.extend(["{message}: " + fts_query(query), f"%{query}%"])
+        elif query:
             where_clauses.append("(c.message LIKE ? OR cc.file_path LIKE ?)")
             search_term = f"%{query}%"
             params.extend([search_term, search_term])
@@ -93,14 +137,7 @@ class DeepSearch:
         c.execute(sql, params)
         results = [dict(row) for row in c.fetchall()]
 
-        # Attach file details
-        for result in results:
-            c.execute("""
-                SELECT file_path, change_type, language, lines_added, lines_removed
-                FROM code_changes
-                WHERE commit_id = ?
-            """, (result['commit_id'],))
-            result['files'] = [dict(row) for row in c.fetchall()]
+        attach_changed_files(conn, results)
 
         return results
 
@@ -121,7 +158,13 @@ class DeepSearch:
         params = []
 
         # Search in code content or diff
-        if query:
+        match_expr = code_fts_query(c, query)
+        if match_expr:
+            where_clauses.append(
+                "cc.id IN (SELECT rowid FROM code_changes_fts WHERE code_changes_fts MATCH ?)"
+            )
+            params.append(match_expr)
+        elif query:
             where_clauses.append(
                 "(cc.code_after LIKE ? OR cc.diff_text LIKE ?)"
             )
@@ -241,6 +284,21 @@ class DeepSearch:
         else:
             where_clauses.append("cc.language IN ('python', 'javascript', 'typescript', 'java', 'go', 'c', 'cpp')")
 
+        # A matching function name is taken from the code itself, so only code
+        # containing function_name needs parsing; let SQLite drop the rest.
+        # Names like "def foo" may be spaced differently in the code, so each
+        # whitespace-separated part is required on its own.
+        for part in function_name.split():
+            match_expr = code_fts_query(c, part, columns="code_after", substring_only=True)
+            if match_expr:
+                where_clauses.append(
+                    "cc.id IN (SELECT rowid FROM code_changes_fts WHERE code_changes_fts MATCH ?)"
+                )
+                params.append(match_expr)
+            else:
+                where_clauses.append("cc.code_after LIKE ?")
+                params.append(f"%{part}%")
+
         where_sql = " AND ".join(where_clauses)
 
         sql = f"""
@@ -318,30 +376,29 @@ class DeepSearch:
         limit: int = 20
     ) -> List[Dict]:
         """Unified search combining all methods"""
-        all_results = []
-
-        # 1. Keyword search
-        all_results.extend(
-            self.keyword_search(query, repo_filter, language, limit)
-        )
-
-        # 2. Code content search
-        all_results.extend(
-            self.code_search(query, repo_filter, language, limit)
-        )
+        # 1. Keyword search, 2. code content search
+        searches = [
+            (self.keyword_search, (query, repo_filter, language, limit)),
+            (self.code_search, (query, repo_filter, language, limit)),
+        ]
 
         # 3. Semantic search (for multi-word queries)
         if len(query.split()) > 2:
-            all_results.extend(
-                self.semantic_search_commits(query, repo_filter, limit)
-            )
+            searches.append((self.semantic_search_commits, (query, repo_filter, limit)))
 
         # 4. Function search (if looks like function name)
         func_name = self._extract_function_name(query)
         if func_name:
-            all_results.extend(
-                self.function_search(func_name, repo_filter, language, limit)
-            )
+            searches.append((self.function_search, (func_name, repo_filter, language, limit)))
+
+        # Independent, and mostly spent in SQLite or the embedding model (both
+        # release the GIL), so run them side by side
+        futures = [self._pool.submit(search, *args) for search, args in searches]
+
+        # Merged in the order above so equal scores rank as before
+        all_results = []
+        for future in futures:
+            all_results.extend(future.result())
 
         # Deduplicate and rank
         return self._deduplicate_and_rank(all_results, limit)
@@ -353,32 +410,58 @@ class DeepSearch:
         if not code:
             return ""
 
-        lines = code.split('\n')
         query_lower = query.lower()
+        code_lower = code.lower()
 
-        for i, line in enumerate(lines):
-            if query_lower in line.lower():
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
-                return '\n'.join(lines[start:end])
+        # One C-level search over the whole text instead of lowering and testing
+        # each line. Offsets into code_lower only map back onto code when
+        # lowercasing kept the length, and a match can't span lines.
+        if len(code_lower) == len(code) and '\n' not in query:
+            idx = code_lower.find(query_lower)
+        else:
+            idx = -1
+            for offset, line in self._line_offsets(code):
+                if query_lower in line.lower():
+                    idx = offset
+                    break
+
+        if idx < 0:
+            return '\n'.join(code.split('\n', 5)[:5])
+
+        # Widen to whole lines, context_lines either side
+        start = idx
+        for _ in range(context_lines + 1):
+            start = code.rfind('\n', 0, start)
+            if start < 0:
+                break
+        start += 1
 
-        return '\n'.join(lines[:5])
+        end = idx - 1
+        for _ in range(context_lines + 1):
+            end = code.find('\n', end + 1)
+            if end < 0:
+                end = len(code)
+                break
+
+        return code[start:end]
+
+    @staticmethod
+    def _line_offsets(code: str):
+        """Yield (offset, line) for each '\n'-separated line"""
+        offset = 0
+        for line in code.split('\n'):
+            yield offset, line
+            offset += len(line) + 1
 
     def _extract_function_name(self, query: str) -> Optional[str]:
         """Extract function name from query"""
-        patterns = [
-            r'function\s+(\w+)',
-            r'method\s+(\w+)',
-            r'class\s+(\w+)',
-            r'def\s+(\w+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, query.lower())
+        query_lower = query.lower()
+        for pattern in _FUNCTION_NAME_PATTERNS:
+            match = pattern.search(query_lower)
             if match:
                 return match.group(1)
 
-        if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', query.strip()):
+        if _IDENTIFIER.match(query.strip()):
             return query.strip()
 
         return None
@@ -419,6 +502,8 @@ class DeepSearch:
     def _deduplicate_and_rank(self, results: List[Dict], limit: int) -> List[Dict]:
         """Deduplicate by commit_id and rank by score"""
         commit_map = {}
+        # file_path sets per commit, kept up to date as files are merged in
+        file_sets = {}
 
         for result in results:
             cid = result['commit_id']
@@ -428,9 +513,15 @@ class DeepSearch:
                 existing['score'] = max(existing['score'], result['score'])
 
                 # Merge files
-                existing_files = {f.get('file_path', '') for f in existing.get('files', [])}
+                existing_files = file_sets.get(cid)
+                if existing_files is None:
+                    existing_files = file_sets[cid] = {
+                        f.get('file_path', '') for f in existing.get('files', [])
+                    }
                 for file in result.get('files', []):
-                    if file.get('file_path', '') not in existing_files:
+                    file_path = file.get('file_path', '')
+                    if file_path not in existing_files:
+                        existing_files.add(file_path)
                         existing['files'].append(file)
 
                 # Merge snippets
@@ -441,13 +532,8 @@ class DeepSearch:
             else:
                 commit_map[cid] = result
 
-        sorted_results = sorted(
-            commit_map.values(),
-            key=lambda x: x.get('score', 0),
-            reverse=True
-        )
-
-        return sorted_results[:limit]
+        # Top-k without sorting every commit; ties keep their merge order, as with sorted()
+        return heapq.nlargest(limit, commit_map.values(), key=lambda x: x.get('score', 0))
 
     def __enter__(self):
         return self
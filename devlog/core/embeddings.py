@@ -2,8 +2,25 @@ from sentence_transformers import SentenceTransformer
 import sqlite3
 import numpy as np
 from typing import List, Dict
-from devlog.paths import DB_PATH
+from devlog.core.db import get_connection
+import functools
 import json
+import threading
+
+try:
+    import faiss
+except ImportError:
+    # Optional: without it semantic_search scans the whole matrix
+    faiss = None
+
+# Texts per model.encode call in embed_all_commits
+EMBED_BATCH_SIZE = 64
+
+# Below this many commits an exact matrix scan beats building an HNSW graph
+FAISS_MIN_VECTORS = 5000
+HNSW_NEIGHBOURS = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
 
 # Load model once (lazy loading)
 _model = None
@@ -21,18 +38,37 @@ def generate_embedding(text: str) -> np.ndarray:
     model = get_model()
     return model.encode(text)
 
+def _encode_embedding(embedding: np.ndarray) -> bytes:
+    """Vector -> raw float32 bytes (~1.5KB for MiniLM vs ~8KB as JSON, no float parsing on read)"""
+    return np.ascontiguousarray(embedding, dtype=np.float32).tobytes()
+
+def _decode_embedding(value) -> np.ndarray:
+    """Stored embedding -> vector (JSON text rows predate the BLOB format)"""
+    if isinstance(value, str):
+        return np.array(json.loads(value), dtype=np.float32)
+    return np.frombuffer(value, dtype=np.float32)
+
+@functools.lru_cache(maxsize=512)
+def _query_embedding(query: str) -> np.ndarray:
+    """Embedding of a search query, memoized: repeated searches skip the model
+
+    The cached array is shared between callers, so it is made read-only.
+    """
+    embedding = np.asarray(generate_embedding(query), dtype=np.float32)
+    embedding.setflags(write=False)
+    return embedding
+
 def store_commit_embedding(commit_id: int, embedding: np.ndarray):
     """Store embedding in database"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_connection()
     c = conn.cursor()
 
-    # Store as JSON array
-    embedding_json = json.dumps(embedding.tolist())
+    embedding_blob = _encode_embedding(embedding)
 
     c.execute("""
         CREATE TABLE IF NOT EXISTS commit_embeddings (
             commit_id INTEGER PRIMARY KEY,
-            embedding TEXT NOT NULL,
+            embedding BLOB NOT NULL,
             FOREIGN KEY(commit_id) REFERENCES git_commits(id)
         )
     """)
@@ -40,14 +76,14 @@ def store_commit_embedding(commit_id: int, embedding: np.ndarray):
     c.execute("""
         INSERT OR REPLACE INTO commit_embeddings (commit_id, embedding)
         VALUES (?, ?)
-    """, (commit_id, embedding_json))
+    """, (commit_id, embedding_blob))
 
     conn.commit()
     conn.close()
 
 def get_commit_embedding(commit_id: int) -> np.ndarray:
     """Retrieve embedding from database"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_connection()
     c = conn.cursor()
 
     c.execute("SELECT embedding FROM commit_embeddings WHERE commit_id = ?", (commit_id,))
@@ -55,13 +91,98 @@ def get_commit_embedding(commit_id: int) -> np.ndarray:
     conn.close()
 
     if result:
-        return np.array(json.loads(result[0]))
+        return _decode_embedding(result[0])
     return None
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """Calculate cosine similarity between two vectors"""
     return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
 
+# Unit-normalized embedding matrix and the commit rows behind it, reused across
+# searches until the database changes. PRAGMA data_version moves whenever
+# another connection commits, so the connection is kept open to compare it.
+_index_conn = None
+_index = None  # (data_version, commits, matrix, hnsw index or None)
+_index_lock = threading.Lock()
+
+def _embedding_index():
+    """(commits, matrix, ann) for all active commits that have an embedding
+
+    ann is a FAISS HNSW index over the embeddings when faiss is installed and
+    there are enough commits for it to pay off (matrix is then None), else None.
+    """
+    global _index_conn, _index
+
+    with _index_lock:
+        if _index_conn is None:
+            # Searches run from worker threads (asyncio.to_thread); the lock serializes them
+            _index_conn = get_connection(check_same_thread=False)
+            _index_conn.row_factory = sqlite3.Row
+
+        version = _index_conn.execute("PRAGMA data_version").fetchone()[0]
+        if _index is not None and _index[0] == version:
+            return _index[1:]
+
+        joins = """
+            FROM git_commits c
+            JOIN tracked_repos r ON c.repo_id = r.id
+            JOIN commit_embeddings ce ON c.id = ce.commit_id
+            WHERE r.active = 1
+        """
+        count = _index_conn.execute("SELECT COUNT(*) " + joins).fetchone()[0]
+        cursor = _index_conn.execute("""
+            SELECT
+                c.id,
+                c.commit_hash,
+                c.short_hash,
+                c.message,
+                c.timestamp,
+                r.repo_name,
+                ce.embedding
+        """ + joins)
+
+        # Decode straight from the cursor into a preallocated matrix rather than
+        # holding every row and a list of vectors alongside it
+        commits = []
+        matrix = None
+        for row in cursor:
+            commit = dict(row)
+            vector = _decode_embedding(commit.pop('embedding'))
+            if matrix is None:
+                matrix = np.empty((count, vector.shape[0]), dtype=np.float32)
+            if len(commits) == len(matrix):
+                # A commit was embedded between the count and this scan
+                grown = np.empty((max(1, 2 * len(matrix)), matrix.shape[1]), dtype=matrix.dtype)
+                grown[:len(matrix)] = matrix
+                matrix = grown
+            matrix[len(commits)] = vector
+            commits.append(commit)
+
+        if matrix is not None:
+            matrix = matrix[:len(commits)]
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix /= np.where(norms == 0, 1, norms)
+        else:
+            matrix = np.empty((0, 0), dtype=np.float32)
+
+        ann = None
+        if faiss is not None and len(commits) >= FAISS_MIN_VECTORS:
+            # Inner product on unit vectors is cosine similarity. Vectors are
+            # held as 8-bit scalar-quantized codes: a quarter of the float32
+            # size, with little effect on which commits make the top k.
+            vectors = np.ascontiguousarray(matrix, dtype=np.float32)
+            ann = faiss.IndexHNSWSQ(
+                matrix.shape[1], faiss.ScalarQuantizer.QT_8bit, HNSW_NEIGHBOURS, faiss.METRIC_INNER_PRODUCT
+            )
+            ann.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            ann.train(vectors)
+            ann.add(vectors)
+            # The index holds its own copy; the float matrix isn't needed any more
+            matrix = None
+
+        _index = (version, commits, matrix, ann)
+        return commits, matrix, ann
+
 def semantic_search(query: str, limit: int = 10) -> List[Dict]:
     """
     Search commits using semantic similarity
@@ -74,46 +195,41 @@ def semantic_search(query: str, limit: int = 10) -> List[Dict]:
         List of commits sorted by relevance
     """
     # Generate query embedding
-    query_embedding = generate_embedding(query)
+    query_embedding = _query_embedding(query)
 
-    # Get all commit embeddings
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    commits, matrix, ann = _embedding_index()
+    if not commits or limit <= 0:
+        return []
 
-    c.execute("""
-        SELECT
-            c.id,
-            c.commit_hash,
-            c.short_hash,
-            c.message,
-            c.timestamp,
-            r.repo_name,
-            ce.embedding
-        FROM git_commits c
-        JOIN tracked_repos r ON c.repo_id = r.id
-        LEFT JOIN commit_embeddings ce ON c.id = ce.commit_id
-        WHERE r.active = 1 AND ce.embedding IS NOT NULL
-    """)
+    norm = np.linalg.norm(query_embedding)
+    if norm:
+        query_embedding = query_embedding / norm
 
-    commits = []
-    for row in c.fetchall():
-        commit = dict(row)
-        embedding = np.array(json.loads(commit['embedding']))
-        similarity = cosine_similarity(query_embedding, embedding)
-        commit['similarity'] = similarity
-        commits.append(commit)
+    if ann is not None:
+        # Approximate nearest neighbours: visits O(log N) commits, not all of them
+        ann.hnsw.efSearch = max(HNSW_EF_SEARCH, limit)
+        scores, ids = ann.search(query_embedding[None, :], min(limit, len(commits)))
+        return [
+            dict(commits[i], similarity=float(score))
+            for score, i in zip(scores[0], ids[0])
+            if i >= 0
+        ]
 
-    conn.close()
+    # Cosine similarity against every commit as one matrix-vector product
+    similarities = matrix @ query_embedding
 
-    # Sort by similarity
-    commits.sort(key=lambda x: x['similarity'], reverse=True)
+    # Only the top `limit` need ordering
+    if limit < len(similarities):
+        top = np.argpartition(-similarities, limit)[:limit]
+    else:
+        top = np.arange(len(similarities))
+    top = top[np.argsort(-similarities[top], kind='stable')]
 
-    return commits[:limit]
+    return [dict(commits[i], similarity=float(similarities[i])) for i in top]
 
 def embed_all_commits():
     """Generate embeddings for all commits that don't have them"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_connection()
     c = conn.cursor()
 
     # Get commits without embeddings
@@ -127,9 +243,9 @@ def embed_all_commits():
     """)
 
     commits = c.fetchall()
-    conn.close()
 
     if not commits:
+        conn.close()
         print("[green]All commits already have embeddings[/]")
         return
 
@@ -137,10 +253,26 @@ def embed_all_commits():
 
     from rich.progress import track
 
-    for commit_id, message, files in track(commits, description="Processing..."):
+    model = get_model()
+
+    batches = range(0, len(commits), EMBED_BATCH_SIZE)
+    for start in track(batches, description="Processing..."):
+        batch = commits[start:start + EMBED_BATCH_SIZE]
         # Combine message and file names for better context
-        text = f"{message} {files or ''}"
-        embedding = generate_embedding(text)
-        store_commit_embedding(commit_id, embedding)
-        print(f"[green]Embeddings generated[/]")
+        texts = [f"{message} {files or ''}" for _, message, files in batch]
+        # One encode call per batch keeps the model busy instead of encoding one text at a time
+        embeddings = model.encode(texts, batch_size=EMBED_BATCH_SIZE, convert_to_numpy=True)
+
+        conn.executemany("""
+            INSERT OR REPLACE INTO commit_embeddings (commit_id, embedding)
+            VALUES (?, ?)
+        """, [
+            (commit_id, _encode_embedding(embedding))
+            for (commit_id, _, _), embedding in zip(batch, embeddings)
+        ])
+        # Per batch, so an interrupted run keeps what it already encoded
+        conn.commit()
+
+    conn.close()
+    print(f"[green]Embeddings generated[/]")
 
@@ -3,7 +3,7 @@ import sqlite3
 import sys
 from pathlib import Path
 from datetime import datetime
-from devlog.paths import DB_PATH
+from devlog.core.db import compress_text, get_connection
 from devlog.core.git_ops import is_git_repo, get_repo_info, get_commit_info, get_file_diff, detect_language
 
 # Post-commit hook template
@@ -45,7 +45,7 @@ def install_hook(repo_path: str) -> bool:
 
         # Add repo to database
         repo_info = get_repo_info(repo_path)
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_connection()
         c = conn.cursor()
 
         try:
@@ -87,7 +87,7 @@ def uninstall_hook(repo_path: str) -> bool:
 
         # Mark as inactive in database
         repo_path_resolved = str(Path(repo_path).resolve())
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_connection()
         c = conn.cursor()
         c.execute("UPDATE tracked_repos SET active = 0 WHERE repo_path = ?",
                   (repo_path_resolved,))
@@ -103,7 +103,7 @@ def uninstall_hook(repo_path: str) -> bool:
 def capture_commit(repo_path: str):
     """Called by post-commit hook to capture commit data"""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_connection()
         c = conn.cursor()
 
         # Get repo ID
@@ -124,6 +124,28 @@ def capture_commit(repo_path: str):
             conn.close()
             return
 
+        # Collect the code changes before writing anything, so the write
+        # transaction isn't held open across the per-file git diff calls
+        change_rows = []
+        for file_info in commit_info['changed_files']:
+            file_path = file_info['path']
+            language = detect_language(file_path)
+
+            # Get diff
+            diff_data = get_file_diff(repo_path, commit_info['hash'], file_path)
+
+            if diff_data:
+                change_rows.append((
+                    file_path,
+                    file_info['change_type'],
+                    language,
+                    diff_data['diff'],
+                    compress_text(diff_data['code_before']),
+                    diff_data['code_after'],
+                    diff_data['lines_added'],
+                    diff_data['lines_removed']
+                ))
+
         # Insert commit
         c.execute("""
             INSERT OR IGNORE INTO git_commits
@@ -145,31 +167,13 @@ def capture_commit(repo_path: str):
 
         commit_id = c.lastrowid
 
-        # Insert code changes
-        for file_info in commit_info['changed_files']:
-            file_path = file_info['path']
-            language = detect_language(file_path)
-
-            # Get diff
-            diff_data = get_file_diff(repo_path, commit_info['hash'], file_path)
-
-            if diff_data:
-                c.execute("""
-                    INSERT INTO code_changes
-                    (commit_id, file_path, change_type, language, diff_text,
-                     code_before, code_after, lines_added, lines_removed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    commit_id,
-                    file_path,
-                    file_info['change_type'],
-                    language,
-                    diff_data['diff'],
-                    diff_data['code_before'],
-                    diff_data['code_after'],
-                    diff_data['lines_added'],
-                    diff_data['lines_removed']
-                ))
+        # Insert code changes, in the same transaction as the commit
+        c.executemany("""
+            INSERT INTO code_changes
+            (commit_id, file_path, change_type, language, diff_text,
+             code_before, code_after, lines_added, lines_removed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(commit_id, *row) for row in change_rows])
 
         # Update repo stats
         c.execute("""
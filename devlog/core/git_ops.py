@@ -1,5 +1,6 @@
 import git
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 
@@ -32,30 +33,39 @@ def get_commit_info(repo_path: str, commit_hash: str = 'HEAD') -> Optional[Dict]
         repo = git.Repo(repo_path)
         commit = repo.commit(commit_hash)
 
-        # Get diff stats
-        stats = commit.stats.total
-
-        # Get changed files
-        changed_files = []
-        if commit.parents:
-            parent = commit.parents[0]
-            diffs = parent.diff(commit)
-
-            for diff in diffs:
-                change_type = 'modified'
-                if diff.new_file:
-                    change_type = 'added'
-                elif diff.deleted_file:
-                    change_type = 'deleted'
-                elif diff.renamed_file:
-                    change_type = 'renamed'
-
-                changed_files.append({
-                    'path': diff.b_path or diff.a_path,
-                    'change_type': change_type,
-                    'a_path': diff.a_path,
-                    'b_path': diff.b_path
-                })
+        # Loads the commit object here, so the stats thread below never uses
+        # GitPython's shared cat-file process
+        parents = commit.parents
+
+        # commit.stats runs its own `git diff --numstat`; let it run while the
+        # changed files are read from the tree diff
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            stats_future = pool.submit(lambda: commit.stats.total)
+
+            # Get changed files
+            changed_files = []
+            if parents:
+                parent = parents[0]
+                diffs = parent.diff(commit)
+
+                for diff in diffs:
+                    change_type = 'modified'
+                    if diff.new_file:
+                        change_type = 'added'
+                    elif diff.deleted_file:
+                        change_type = 'deleted'
+                    elif diff.renamed_file:
+                        change_type = 'renamed'
+
+                    changed_files.append({
+                        'path': diff.b_path or diff.a_path,
+                        'change_type': change_type,
+                        'a_path': diff.a_path,
+                        'b_path': diff.b_path
+                    })
+
+            # Get diff stats
+            stats = stats_future.result()
 
         return {
             'hash': commit.hexsha,
@@ -1,7 +1,13 @@
 import sqlite3
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
-from devlog.paths import DB_PATH
+from devlog.core.db import (
+    attach_changed_files, code_fts_query, decompress_text, fts_query, get_conn, has_commits_fts
+)
+
+def _open(conn: Optional[sqlite3.Connection]) -> sqlite3.Connection:
+    """Use the caller's connection if given, else this thread's shared one"""
+    return conn if conn is not None else get_conn()
 
 def search_commits(
     query: Optional[str] = None,
@@ -9,31 +15,66 @@ def search_commits(
     language: Optional[str] = None,
     after_date: Optional[str] = None,
     before_date: Optional[str] = None,
-    limit: int = 50
+    limit: int = 50,
+    conn: Optional[sqlite3.Connection] = None
 ) -> List[Dict]:
     """
     Search commits with various filters
 
     Args:
-        query: Search in commit message and file paths
+        query: Search in commit message, author and file paths
         repo_name: Filter by repository name
         language: Filter by programming language
         after_date: ISO format date (YYYY-MM-DD)
         before_date: ISO format date (YYYY-MM-DD)
         limit: Maximum results
+        conn: Open connection to reuse; this thread's shared one if omitted
 
     Returns:
         List of matching commits with details
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+    conn = _open(conn)
     c = conn.cursor()
+    c.row_factory = sqlite3.Row  # Return rows as dictionaries
 
     # Build query dynamically
     where_clauses = ["r.active = 1"]
     params = []
-
-    if query:
+    rank_join = ""
+    order_by = "c.timestamp DESC"
+
+    if query and query.strip() and has_commits_fts(c):
+        # Message/author matches come from the FTS index instead of a LIKE
+        # scan, and are ranked by BM25 ahead of file-path-only matches
+        rank_join = """
+            LEFT JOIN (
+                SELECT rowid, bm25(commits_fts) AS rank
+                FROM commits_fts WHERE commits_fts MATCH ?
+            ) f ON f.rowid = c.id
+        """
+        message_query = fts_query(query)
+        params.append(message_query)
+        order_by = "COALESCE(f.rank, 0), c.timestamp DESC"
+
+        path_query = code_fts_query(c, query, columns="file_path", substring_only=True)
+        if path_query:
+            path_match = "cc.id IN (SELECT rowid FROM code_changes_fts WHERE code_changes_fts MATCH ?)"
+            path_param = path_query
+        else:
+            path_match = "cc.file_path LIKE ?"
+            path_param = f"%{query}%"
+
+        # Candidate commits straight from the indexes, so the planner looks
+        # them up by id instead of scanning every commit; the second clause
+        # keeps file-path matches tied to the joined file, as before
+        where_clauses.append(f"""c.id IN (
+            SELECT rowid FROM commits_fts WHERE commits_fts MATCH ?
+            UNION
+            SELECT cc.commit_id FROM code_changes cc WHERE {path_match}
+        )""")
+        where_clauses.append(f"(f.rowid IS NOT NULL OR {path_match})")
+        params.extend([message_query, path_param, path_param])
+    elif query:
         where_clauses.append(
             "(c.message LIKE ? OR cc.file_path LIKE ?)"
         )
@@ -58,9 +99,18 @@ def search_commits(
 
     where_sql = " AND ".join(where_clauses)
 
+    # code_changes is only joined when a filter reads it; without the join
+    # each commit is one row and needs no DISTINCT
+    if query or language:
+        distinct = "DISTINCT"
+        changes_join = "LEFT JOIN code_changes cc ON c.id = cc.commit_id"
+    else:
+        distinct = ""
+        changes_join = ""
+
     # Main query - get commits with file changes
     sql = f"""
-        SELECT DISTINCT
+        SELECT {distinct}
             c.id as commit_id,
             c.commit_hash,
             c.short_hash,
@@ -75,9 +125,10 @@ def search_commits(
             r.repo_path
         FROM git_commits c
         JOIN tracked_repos r ON c.repo_id = r.id
-        LEFT JOIN code_changes cc ON c.id = cc.commit_id
+        {changes_join}
+        {rank_join}
         WHERE {where_sql}
-        ORDER BY c.timestamp DESC
+        ORDER BY {order_by}
         LIMIT ?
     """
 
@@ -86,23 +137,18 @@ def search_commits(
     c.execute(sql, params)
     results = [dict(row) for row in c.fetchall()]
 
-    # For each commit, get the changed files
-    for result in results:
-        c.execute("""
-            SELECT file_path, change_type, language, lines_added, lines_removed
-            FROM code_changes
-            WHERE commit_id = ?
-        """, (result['commit_id'],))
-        result['files'] = [dict(row) for row in c.fetchall()]
+    attach_changed_files(conn, results)
 
-    conn.close()
     return results
 
-def get_commit_details(commit_hash: str) -> Optional[Dict]:
+def get_commit_details(
+    commit_hash: str,
+    conn: Optional[sqlite3.Connection] = None
+) -> Optional[Dict]:
     """Get full details for a specific commit"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = _open(conn)
     c = conn.cursor()
+    c.row_factory = sqlite3.Row
 
     # Get commit info
     c.execute("""
@@ -117,28 +163,33 @@ def get_commit_details(commit_hash: str) -> Optional[Dict]:
 
     commit = c.fetchone()
     if not commit:
-        conn.close()
         return None
 
     commit_dict = dict(commit)
 
     # Get code changes
     c.execute("""
-        SELECT *
+        SELECT
+            id, commit_id, file_path, change_type, language, diff_text,
+            code_before, code_after, lines_added, lines_removed
         FROM code_changes
         WHERE commit_id = ?
+        ORDER BY id
     """, (commit_dict['id'],))
 
-    commit_dict['changes'] = [dict(row) for row in c.fetchall()]
+    changes = []
+    for row in c.fetchall():
+        change = dict(row)
+        change['code_before'] = decompress_text(change['code_before'])
+        changes.append(change)
+    commit_dict['changes'] = changes
 
-    conn.close()
     return commit_dict
 
 def search_by_file_pattern(pattern: str, limit: int = 50) -> List[Dict]:
     """Search commits that modified files matching a pattern"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    c = get_conn().cursor()
+    c.row_factory = sqlite3.Row
 
     c.execute("""
         SELECT DISTINCT
@@ -159,13 +210,11 @@ def search_by_file_pattern(pattern: str, limit: int = 50) -> List[Dict]:
     """, (f"%{pattern}%", limit))
 
     results = [dict(row) for row in c.fetchall()]
-    conn.close()
     return results
 
 def get_languages_used() -> List[tuple]:
     """Get all programming languages used with counts"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
+    c = get_conn().cursor()
 
     c.execute("""
         SELECT language, COUNT(*) as count
@@ -176,14 +225,12 @@ def get_languages_used() -> List[tuple]:
     """)
 
     results = c.fetchall()
-    conn.close()
     return results
 
 def get_recent_files(limit: int = 20) -> List[Dict]:
     """Get recently modified files across all repos"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    c = get_conn().cursor()
+    c.row_factory = sqlite3.Row
 
     c.execute("""
         SELECT
@@ -203,5 +250,4 @@ def get_recent_files(limit: int = 20) -> List[Dict]:
     """, (limit,))
 
     results = [dict(row) for row in c.fetchall()]
-    conn.close()
     return results
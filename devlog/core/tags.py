@@ -3,13 +3,13 @@ Tag management for commits
 """
 import sqlite3
 from datetime import datetime
-from devlog.paths import DB_PATH
+from devlog.core.db import get_conn
 from typing import List, Dict
 
 
 def add_tag(commit_hash: str, tag: str) -> bool:
     """Add tag to commit"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn()
     c = conn.cursor()
 
     # Get commit ID
@@ -20,47 +20,41 @@ def add_tag(commit_hash: str, tag: str) -> bool:
 
     result = c.fetchone()
     if not result:
-        conn.close()
         return False
 
     commit_id = result[0]
 
     try:
-        c.execute("""
-            INSERT INTO commit_tags (commit_id, tag, created_at)
-            VALUES (?, ?, ?)
-        """, (commit_id, tag, datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        # Commits, or rolls back so the shared connection isn't left mid-transaction
+        with conn:
+            conn.execute("""
+                INSERT INTO commit_tags (commit_id, tag, created_at)
+                VALUES (?, ?, ?)
+            """, (commit_id, tag, datetime.now().isoformat()))
         return True
     except sqlite3.IntegrityError:
-        conn.close()
         return False
 
 
 def remove_tag(commit_hash: str, tag: str) -> bool:
     """Remove tag from commit"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
+    conn = get_conn()
 
-    c.execute("""
-        DELETE FROM commit_tags
-        WHERE commit_id = (
-            SELECT id FROM git_commits
-            WHERE commit_hash LIKE ? OR short_hash = ?
-        ) AND tag = ?
-    """, (f"{commit_hash}%", commit_hash, tag))
+    with conn:
+        c = conn.execute("""
+            DELETE FROM commit_tags
+            WHERE commit_id = (
+                SELECT id FROM git_commits
+                WHERE commit_hash LIKE ? OR short_hash = ?
+            ) AND tag = ?
+        """, (f"{commit_hash}%", commit_hash, tag))
 
-    deleted = c.rowcount > 0
-    conn.commit()
-    conn.close()
-    return deleted
+    return c.rowcount > 0
 
 
 def get_tags(commit_hash: str) -> List[str]:
     """Get all tags for a commit"""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
+    c = get_conn().cursor()
 
     c.execute("""
         SELECT t.tag FROM commit_tags t
@@ -69,15 +63,13 @@ def get_tags(commit_hash: str) -> List[str]:
     """, (f"{commit_hash}%", commit_hash))
 
     tags = [row[0] for row in c.fetchall()]
-    conn.close()
     return tags
 
 
 def search_by_tag(tag: str) -> List[Dict]:
     """Find commits with specific tag"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
+    c = get_conn().cursor()
+    c.row_factory = sqlite3.Row
 
     c.execute("""
         SELECT c.*, r.repo_name
@@ -89,5 +81,4 @@ def search_by_tag(tag: str) -> List[Dict]:
     """, (tag,))
 
     results = [dict(row) for row in c.fetchall()]
-    conn.close()
     return results
@@ -0,0 +1,43 @@
+import os
+import tempfile
+
+# devlog.paths reads ~ at import time, so point it at a throwaway home first
+os.environ["HOME"] = tempfile.mkdtemp(prefix="devlog-test-")
+
+import pytest
+
+from devlog.core import db
+
+COMMIT_HASH = "a" * 40
+
+
+@pytest.fixture
+def seeded_db():
+    """Fresh tables holding one tracked repo with one commit and two changed files"""
+    db.init_db()
+    conn = db.get_connection()
+    with conn:
+        for table in ("commit_tags", "commit_embeddings", "analyses", "code_changes",
+                      "git_commits", "tracked_repos"):
+            conn.execute(f"DELETE FROM {table}")
+        conn.execute(
+            "INSERT INTO tracked_repos (id, repo_name, repo_path, tracked_since)"
+            " VALUES (1, 'demo', '/tmp/demo', '2024-01-01')"
+        )
+        conn.execute(
+            "INSERT INTO git_commits (id, repo_id, commit_hash, short_hash, message, author, timestamp)"
+            " VALUES (1, 1, ?, ?, 'Fix auth token bug', 'me', '2024-01-02T10:00:00')",
+            (COMMIT_HASH, COMMIT_HASH[:7])
+        )
+        for path, before, after in (
+            ("src/b.py", "def old_b():\n    pass\n", "def b():\n    return 2\n"),
+            ("src/a.py", "def old_a():\n    pass\n", "def a():\n    return 1\n"),
+        ):
+            conn.execute(
+                "INSERT INTO code_changes (commit_id, file_path, change_type, language,"
+                " diff_text, code_before, code_after, lines_added)"
+                " VALUES (1, ?, 'modified', 'python', '+x', ?, ?, 1)",
+                (path, db.compress_text(before), after)
+            )
+    conn.close()
+    return COMMIT_HASH
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("textual")
+
+from devlog.cli import updated_chat_tui
+
+
+class FakeChatManager:
+    """Streams each reply's characters with a small delay between them"""
+
+    def __init__(self, replies):
+        self.replies = replies
+
+    async def send_message(self, message):
+        for char in self.replies[message]:
+            await asyncio.sleep(0.002)
+            yield char
+
+    def clear_history(self):
+        pass
+
+
+def test_interrupted_reply_does_not_leak_into_next(monkeypatch):
+    manager = FakeChatManager({"first": "x" * 500, "second": "y" * 40})
+    monkeypatch.setattr(updated_chat_tui, "ChatManager", lambda: manager)
+    monkeypatch.setattr(updated_chat_tui, "test_connection", lambda: True)
+
+    async def run():
+        app = updated_chat_tui.EnhancedDevLogChat()
+        async with app.run_test() as pilot:
+            panel = app.query_one(updated_chat_tui.ChatPanel)
+            await panel.send_message("first")
+            # Part-way through the first reply, with tokens still buffered
+            await asyncio.sleep(0.1)
+            await panel.send_message("second")
+            # wait_for_complete() would raise for the cancelled first worker
+            while any(worker.is_running for worker in app.workers):
+                await asyncio.sleep(0.01)
+            await pilot.pause()
+            return str(panel._ai_text), panel.last_ai_response_text, panel._flush_timer
+
+    shown, copied, timer = asyncio.run(run())
+    assert shown == "DevLog: " + "y" * 40
+    assert copied == "y" * 40
+    assert timer is None
@@ -0,0 +1,50 @@
+import sqlite3
+
+import pytest
+
+from devlog.core import db
+
+
+def _code_fts_sql(conn):
+    return conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name='code_changes_fts'"
+    ).fetchone()[0]
+
+
+@pytest.mark.skipif(sqlite3.sqlite_version_info < db.TRIGRAM_MIN_VERSION, reason="no trigram")
+def test_legacy_code_fts_index_is_rebuilt_with_trigram(seeded_db):
+    conn = db.get_connection()
+    with conn:
+        for name in db._CODE_FTS_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        conn.execute("DROP TABLE code_changes_fts")
+        # What the old db_migration created: no tokenize option, so unicode61
+        conn.execute("""
+            CREATE VIRTUAL TABLE code_changes_fts USING fts5(
+                commit_id UNINDEXED, file_path, code_after, diff_text, language UNINDEXED,
+                content='code_changes', content_rowid='id'
+            )
+        """)
+    assert db.code_fts_tokenizer(conn.cursor()) == "unicode61"
+
+    with conn:
+        assert db.init_code_changes_fts(conn.cursor()) == "trigram"
+    assert db.code_fts_tokenizer(conn.cursor()) == "trigram"
+    assert "'trigram'" in _code_fts_sql(conn)
+
+    # Substring match inside an identifier only works with trigram
+    rows = conn.execute(
+        "SELECT file_path FROM code_changes_fts WHERE code_changes_fts MATCH ?",
+        ('{code_after}: "eturn 1"',)
+    ).fetchall()
+    conn.close()
+    assert rows == [("src/a.py",)]
+
+
+def test_tokenizer_parsed_from_table_sql():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE code_changes (id INTEGER PRIMARY KEY)")
+    conn.execute(
+        "CREATE VIRTUAL TABLE code_changes_fts USING fts5(x, tokenize=\"unicode61 remove_diacritics 2\")"
+    )
+    assert db.code_fts_tokenizer(conn.cursor()) == "unicode61 remove_diacritics 2"
@@ -0,0 +1,19 @@
+from devlog.core.deep_search import DeepSearch, SEARCH_WORKERS
+
+
+def test_search_all_reuses_worker_connections(seeded_db):
+    with DeepSearch() as searcher:
+        for _ in range(5):
+            assert searcher.search_all("auth")
+            assert searcher.search_all("def a")
+        assert len(searcher._conns) <= SEARCH_WORKERS
+        conns = searcher._conns
+
+    assert searcher._conns == []
+    # close() closed them all
+    for conn in conns:
+        try:
+            conn.execute("SELECT 1")
+        except Exception:
+            continue
+        raise AssertionError("connection left open")
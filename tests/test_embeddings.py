@@ -0,0 +1,45 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from devlog.core import db, embeddings
+
+
+class StaleCountConnection:
+    """Reports no embedded commits to COUNT(*), as if they were added after it ran"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def execute(self, sql, *args):
+        if sql.startswith("SELECT COUNT(*)"):
+            return self._conn.execute("SELECT 0")
+        return self._conn.execute(sql, *args)
+
+
+def test_index_grows_past_a_stale_zero_count(monkeypatch, seeded_db):
+    with db.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO git_commits (id, repo_id, commit_hash, short_hash, message, author, timestamp)"
+            " VALUES (2, 1, ?, ?, 'Add login page', 'me', '2024-01-03T10:00:00')",
+            ("b" * 40, "b" * 7)
+        )
+    embeddings.store_commit_embedding(1, np.array([3.0, 4.0], dtype=np.float32))
+    embeddings.store_commit_embedding(2, np.array([0.0, 2.0], dtype=np.float32))
+
+    conn = db.get_connection(check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    monkeypatch.setattr(embeddings, "_index_conn", StaleCountConnection(conn))
+    monkeypatch.setattr(embeddings, "_index", None)
+
+    commits, matrix, ann = embeddings._embedding_index()
+    conn.close()
+
+    assert ann is None
+    rows = {commit['id']: vector for commit, vector in zip(commits, matrix)}
+    assert len(matrix) == 2
+    np.testing.assert_allclose(rows[1], [0.6, 0.8])
+    np.testing.assert_allclose(rows[2], [0.0, 1.0])
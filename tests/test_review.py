@@ -0,0 +1,42 @@
+import asyncio
+import threading
+import time
+
+from devlog.analysis.review import ReviewPipeline
+
+
+class SlowSearcher:
+    """Web search that doesn't answer until released"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def search_topic(self, topic, language, limit):
+        self.started.set()
+        self.release.wait(5)
+        return []
+
+
+def test_topic_without_commits_does_not_wait_for_web_search(monkeypatch):
+    searcher = SlowSearcher()
+    pipeline = ReviewPipeline(analyzer=object(), searcher=searcher)
+
+    def find_nothing(topic, limit):
+        searcher.started.wait(1)
+        return []
+
+    monkeypatch.setattr(pipeline, "_find_relevant_commits", find_nothing)
+
+    async def run():
+        started = time.monotonic()
+        try:
+            review = await pipeline.review_topic("nothing here")
+            return review, time.monotonic() - started
+        finally:
+            searcher.release.set()
+
+    review, elapsed = asyncio.run(run())
+    assert searcher.started.is_set()
+    assert review['error'] == "No commits found related to 'nothing here'"
+    assert elapsed < 2
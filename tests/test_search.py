@@ -0,0 +1,17 @@
+from devlog.core.search import get_commit_details
+
+
+def test_commit_details_decompress_code_before(seeded_db):
+    details = get_commit_details(seeded_db[:7])
+
+    before = {change['file_path']: change['code_before'] for change in details['changes']}
+    assert before == {
+        "src/b.py": "def old_b():\n    pass\n",
+        "src/a.py": "def old_a():\n    pass\n",
+    }
+
+
+def test_commit_details_keep_files_in_insertion_order(seeded_db):
+    details = get_commit_details(seeded_db[:7])
+
+    assert [change['file_path'] for change in details['changes']] == ["src/b.py", "src/a.py"]
@@ -0,0 +1,110 @@
+import asyncio
+import io
+import threading
+
+import pytest
+
+pytest.importorskip("textual")
+
+from rich.console import Console
+
+from devlog.analysis import llm
+from devlog.cli import tui
+
+
+def test_analyze_after_probe_reuses_cached_result(monkeypatch, seeded_db):
+    """Pressing 'a' once the startup probe has filled the cache must not crash"""
+    probes = []
+    monkeypatch.setattr(llm, "test_connection", lambda: probes.append(1) or False)
+    monkeypatch.setattr(tui, "_last_conn_check", (0.0, False))
+
+    async def run():
+        app = tui.DevLogTUI()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            assert probes == [1]
+
+            app.query_one("#commit-list", tui.CommitList).index = 0
+            await pilot.pause()
+            await pilot.press("a")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+        return app
+
+    app = asyncio.run(run())
+    assert app.return_code in (None, 0)
+    # Answered from the cache filled by the startup probe
+    assert probes == [1]
+
+
+def test_review_after_probe_reuses_cached_result(monkeypatch, seeded_db):
+    """run_review goes through the same cached probe as 'a'"""
+    probes = []
+    monkeypatch.setattr(llm, "test_connection", lambda: probes.append(1) or False)
+    monkeypatch.setattr(tui, "_last_conn_check", (0.0, False))
+
+    async def run():
+        app = tui.DevLogTUI()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            app.run_review("auth", "python", 3)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            state = app.query_one("#review-workflow", tui.ReviewWorkflow).review_state
+        return app, state
+
+    app, state = asyncio.run(run())
+    assert app.return_code in (None, 0)
+    assert state == "idle"
+    assert probes == [1]
+
+
+def test_startup_does_not_wait_for_probe(monkeypatch, seeded_db):
+    """The timeline loads while the startup probe is still running"""
+    release = threading.Event()
+    monkeypatch.setattr(llm, "test_connection", lambda: release.wait(5) and False)
+    monkeypatch.setattr(tui, "_last_conn_check", (0.0, False))
+
+    async def run():
+        app = tui.DevLogTUI()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            loaded = len(app._commit_list.commits)
+            probing = tui._last_conn_check == (0.0, False)
+            release.set()
+            await app.workers.wait_for_complete()
+            checked_at, _ = tui._last_conn_check
+        return loaded, probing, checked_at
+
+    loaded, probing, checked_at = asyncio.run(run())
+    assert loaded == 1
+    assert probing
+    # The probe then fills the cache the actions read
+    assert checked_at > 0
+
+
+def test_warmed_syntax_renders_without_lexing_again(monkeypatch):
+    syntax = tui._build_syntax("def f():\n\treturn 1", "python", start_line=7)
+    assert not syntax.is_warm
+    syntax.warm()
+    assert syntax.is_warm
+
+    def fail(*args, **kwargs):
+        raise AssertionError("lexer ran again")
+
+    monkeypatch.setattr(tui.Syntax, "highlight", fail)
+    console = Console(file=io.StringIO(), width=60)
+    console.print(syntax)
+    assert "return 1" in console.file.getvalue()
+
+
+def test_window_chunks_share_one_gutter_width():
+    """Chunks either side of line 1000 put their code in the same column"""
+    chunk = tui.CodeViewer.WINDOW_CHUNK
+    code = "\n".join(["x = 1"] * chunk)
+    console = Console(file=io.StringIO(), width=60, color_system=None)
+    for start_line in (1000 - 2 * chunk + 1, 1000 - chunk + 1):
+        console.print(tui._build_syntax(code, "python", start_line, 4))
+
+    columns = {line.index("x = 1") for line in console.file.getvalue().splitlines() if "x = 1" in line}
+    assert len(columns) == 1